@@ -7,6 +7,7 @@ import (
 	"fmt"
 	"regexp"
 	"slices"
+	"strconv"
 	"strings"
 )
 
@@ -157,12 +158,12 @@ func JoinPath(parent, child string) string {
 	if parent == "" {
 		return child
 	}
-	return fmt.Sprintf("%s.%s", parent, child)
+	return parent + "." + child
 }
 
 // IndexPath creates a path for an array index.
 func IndexPath(parent string, index int) string {
-	return fmt.Sprintf("%s[%d]", parent, index)
+	return parent + "[" + strconv.Itoa(index) + "]"
 }
 
 // KeyPath creates a path for a map key.
@@ -382,6 +383,12 @@ func ValidateNotEmpty(value, path, fieldName string) string {
 
 // --- Template Validation ---
 
+// Template patterns are compiled once and shared by every call
+var (
+	variableRefPattern     = regexp.MustCompile(`\{\{[^}]*\b[a-z_][a-z0-9_]*\b[^}]*\}\}`)
+	inputInTemplatePattern = regexp.MustCompile(`\{\{[^}]*!input[^}]*\}\}`)
+)
+
 // ContainsTemplate checks if a string contains Jinja2 template markers.
 func ContainsTemplate(s string) bool {
 	return strings.Contains(s, "{{") || strings.Contains(s, "{%")
@@ -394,19 +401,28 @@ func ContainsInputRef(s string) bool {
 
 // ContainsVariableRef checks if template contains variable references (not !input).
 func ContainsVariableRef(template string) bool {
-	varPattern := regexp.MustCompile(`\{\{[^}]*\b[a-z_][a-z0-9_]*\b[^}]*\}\}`)
-	return varPattern.MatchString(template)
+	// Without an expression opener the pattern cannot match
+	if !strings.Contains(template, "{{") {
+		return false
+	}
+	return variableRefPattern.MatchString(template)
 }
 
 // ValidateBalancedDelimiters checks for balanced Jinja2 delimiters.
 // Returns error messages for any unbalanced delimiters.
 func ValidateBalancedDelimiters(template, path string) []string {
+	// Every delimiter contains a brace; most strings have none and need no counting
+	if strings.IndexByte(template, '{') < 0 && strings.IndexByte(template, '}') < 0 {
+		return nil
+	}
+
 	var errors []string
 
 	if strings.Count(template, "{{") != strings.Count(template, "}}") {
 		errors = append(errors, fmt.Sprintf("%s: unbalanced {{ }} delimiters", path))
 	}
-	if strings.Count(template, "{%") != strings.Count(template, "%}") {
+	// Statement delimiters also need a '%'
+	if strings.IndexByte(template, '%') >= 0 && strings.Count(template, "{%") != strings.Count(template, "%}") {
 		errors = append(errors, fmt.Sprintf("%s: unbalanced {%% %%} delimiters", path))
 	}
 
@@ -416,7 +432,10 @@ func ValidateBalancedDelimiters(template, path string) []string {
 // ValidateNoInputInTemplate checks that !input is not used inside {{ }} blocks.
 // Returns an error message if !input is found inside template blocks, or empty string if valid.
 func ValidateNoInputInTemplate(template, path string) string {
-	inputInTemplatePattern := regexp.MustCompile(`\{\{[^}]*!input[^}]*\}\}`)
+	// Literal scans are far cheaper than the regex and rule out almost every string
+	if !strings.Contains(template, "!input") || !strings.Contains(template, "{{") {
+		return ""
+	}
 	if inputInTemplatePattern.MatchString(template) {
 		return fmt.Sprintf("%s: cannot use !input tags inside {{ }} blocks. Assign the input to a variable first", path)
 	}
@@ -458,14 +477,36 @@ func TraverseValue(value interface{}, path string, visitor TraversalFunc) {
 	}
 }
 
+// WalkStrings calls visit for every string in a value, in document order for lists.
+// Unlike TraverseValue it builds no paths, for callers that never report one,
+// and it walks with an explicit stack so nesting depth costs no recursion.
+func WalkStrings(value interface{}, visit func(s string)) {
+	stack := []interface{}{value}
+	for len(stack) > 0 {
+		top := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+
+		switch val := top.(type) {
+		case string:
+			visit(val)
+		case map[string]interface{}:
+			for _, v := range val {
+				stack = append(stack, v)
+			}
+		case []interface{}:
+			// Push in reverse so items are visited in order
+			for i := len(val) - 1; i >= 0; i-- {
+				stack = append(stack, val[i])
+			}
+		}
+	}
+}
+
 // CollectStrings traverses a value and collects all string values.
 func CollectStrings(value interface{}) []string {
 	var collected []string
-	TraverseValue(value, "", func(v interface{}, _ string) bool {
-		if s, ok := v.(string); ok {
-			collected = append(collected, s)
-		}
-		return true
+	WalkStrings(value, func(s string) {
+		collected = append(collected, s)
 	})
 	return collected
 }
@@ -504,13 +545,10 @@ func ExtractInputRef(value string) string {
 func CollectInputRefsFromValue(value interface{}) map[string]bool {
 	refs := make(map[string]bool)
 
-	TraverseValue(value, "", func(v interface{}, _ string) bool {
-		if s, ok := v.(string); ok {
-			if inputName := ExtractInputRef(s); inputName != "" {
-				refs[inputName] = true
-			}
+	WalkStrings(value, func(s string) {
+		if inputName := ExtractInputRef(s); inputName != "" {
+			refs[inputName] = true
 		}
-		return true
 	})
 
 	return refs
@@ -1,6 +1,7 @@
 package validators
 
 import (
+	"reflect"
 	"testing"
 )
 
@@ -187,6 +188,9 @@ func TestPathFunctions(t *testing.T) {
 	if IndexPath("arr", 0) != "arr[0]" {
 		t.Error("IndexPath failed")
 	}
+	if IndexPath("action[2].sequence", 12) != "action[2].sequence[12]" {
+		t.Error("IndexPath with nested parent failed")
+	}
 
 	// KeyPath
 	if KeyPath("obj", "key") != "obj.key" {
@@ -381,6 +385,18 @@ func TestContainsInputRef(t *testing.T) {
 	}
 }
 
+func TestContainsVariableRef(t *testing.T) {
+	if !ContainsVariableRef("{{ my_var | float(0) }}") {
+		t.Error("Should detect variable inside {{ }}")
+	}
+	if ContainsVariableRef("light.living_room") {
+		t.Error("Should not detect in plain text")
+	}
+	if ContainsVariableRef("{% if my_var %}on{% endif %}") {
+		t.Error("Should not detect variables in statement blocks only")
+	}
+}
+
 func TestValidateBalancedDelimiters(t *testing.T) {
 	// Balanced
 	errors := ValidateBalancedDelimiters("{{ value }}", "test")
@@ -404,6 +420,18 @@ func TestValidateBalancedDelimiters(t *testing.T) {
 	if len(errors) != 1 {
 		t.Error("Should fail for unbalanced {% %}")
 	}
+
+	// No braces at all
+	errors = ValidateBalancedDelimiters("light.living_room 100%", "test")
+	if len(errors) != 0 {
+		t.Error("Should pass for plain text without braces")
+	}
+
+	// Stray closing delimiters without any opening brace
+	errors = ValidateBalancedDelimiters("value }} done %}", "test")
+	if len(errors) != 2 {
+		t.Error("Should fail for stray }} and %} delimiters")
+	}
 }
 
 func TestValidateNoInputInTemplate(t *testing.T) {
@@ -414,6 +442,14 @@ func TestValidateNoInputInTemplate(t *testing.T) {
 	if err := ValidateNoInputInTemplate("!input my_input", "test"); err != "" {
 		t.Error("Should pass for !input outside {{ }}")
 	}
+
+	if err := ValidateNoInputInTemplate("{{ value }} !input my_input", "test"); err != "" {
+		t.Error("Should pass for !input after a closed {{ }} block")
+	}
+
+	if err := ValidateNoInputInTemplate("{{ states('sensor.x') }}", "test"); err != "" {
+		t.Error("Should pass for template without !input")
+	}
 }
 
 func TestValidateNoTemplateInField(t *testing.T) {
@@ -463,6 +499,28 @@ func TestCollectStrings(t *testing.T) {
 	}
 }
 
+func TestWalkStrings(t *testing.T) {
+	// List items are visited in order
+	var got []string
+	WalkStrings([]interface{}{"a", []interface{}{"b", "c"}, 1, "d"}, func(s string) {
+		got = append(got, s)
+	})
+	if want := []string{"a", "b", "c", "d"}; !reflect.DeepEqual(got, want) {
+		t.Errorf("WalkStrings order = %v, want %v", got, want)
+	}
+
+	// Deep nesting is walked without recursion
+	var deep interface{} = "leaf"
+	for range 10000 {
+		deep = map[string]interface{}{"sequence": []interface{}{deep}}
+	}
+	count := 0
+	WalkStrings(deep, func(string) { count++ })
+	if count != 1 {
+		t.Errorf("WalkStrings deep count = %d, want 1", count)
+	}
+}
+
 func TestExtractInputRef(t *testing.T) {
 	if ref := ExtractInputRef("!input my_input"); ref != "my_input" {
 		t.Errorf("ExtractInputRef = %q, want %q", ref, "my_input")
@@ -0,0 +1,155 @@
+// Package cache stores validation results between runs so unchanged
+// blueprints can be skipped by incremental `--all` validation.
+package cache
+
+import (
+	"encoding/json"
+	"errors"
+	"os"
+	"path/filepath"
+	"sync"
+)
+
+// Entry is the cached validation outcome for a single blueprint file
+type Entry struct {
+	// ModTime is the blueprint file modification time in nanoseconds
+	ModTime int64 `json:"mtime_ns"`
+	// Size is the blueprint file size in bytes
+	Size int64 `json:"size"`
+	// DirModTime is the containing directory modification time in nanoseconds.
+	// It changes when files such as README.md or CHANGELOG.md are added or removed.
+	DirModTime int64 `json:"dir_mtime_ns"`
+	// Success is whether validation passed
+	Success bool `json:"success"`
+	// Output is the report printed for the blueprint
+	Output string `json:"output"`
+}
+
+// Cache maps blueprint paths to their last validation result.
+// It is safe for concurrent use.
+type Cache struct {
+	path    string
+	version string
+
+	mu      sync.Mutex
+	entries map[string]Entry
+}
+
+// file is the on-disk representation of a Cache
+type file struct {
+	Version string           `json:"version"`
+	Entries map[string]Entry `json:"entries"`
+}
+
+// Load reads the cache stored at path. A missing or unreadable file, or one
+// written by a different validator version, yields an empty cache.
+func Load(path, version string) *Cache {
+	c := &Cache{path: path, version: version, entries: make(map[string]Entry)}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return c
+	}
+
+	var stored file
+	if err := json.Unmarshal(data, &stored); err != nil || stored.Version != version || stored.Entries == nil {
+		return c
+	}
+
+	c.entries = stored.Entries
+	return c
+}
+
+// Fingerprint identifies the state of a blueprint file and its directory
+// at the moment it was taken
+type Fingerprint struct {
+	modTime    int64
+	size       int64
+	dirModTime int64
+	known      bool
+}
+
+// Lookup returns the cached entry for a blueprint if the file and its
+// directory are unchanged since the entry was stored. On a miss it returns
+// the blueprint's current fingerprint, which should be taken before the file
+// is read and passed to Store with the new result.
+func (c *Cache) Lookup(blueprintPath string) (Entry, Fingerprint, bool) {
+	fp := fingerprint(blueprintPath)
+	if !fp.known {
+		return Entry{}, fp, false
+	}
+
+	c.mu.Lock()
+	entry, found := c.entries[blueprintPath]
+	c.mu.Unlock()
+
+	if !found || entry.ModTime != fp.modTime || entry.Size != fp.size || entry.DirModTime != fp.dirModTime {
+		return Entry{}, fp, false
+	}
+	return entry, fp, true
+}
+
+// Store records the validation result for a blueprint under the fingerprint
+// taken before it was validated, so edits made during validation invalidate
+// the entry instead of being attributed to the old result
+func (c *Cache) Store(blueprintPath string, fp Fingerprint, success bool, output []byte) {
+	if !fp.known {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.entries[blueprintPath] = Entry{
+		ModTime:    fp.modTime,
+		Size:       fp.size,
+		DirModTime: fp.dirModTime,
+		Success:    success,
+		Output:     string(output),
+	}
+}
+
+// Save writes the cache to disk, creating its directory if needed.
+// The file is replaced atomically so an interrupted write never leaves it truncated.
+func (c *Cache) Save() error {
+	c.mu.Lock()
+	data, err := json.Marshal(file{Version: c.version, Entries: c.entries})
+	c.mu.Unlock()
+	if err != nil {
+		return err
+	}
+
+	if err := os.MkdirAll(filepath.Dir(c.path), 0o750); err != nil {
+		return err
+	}
+
+	tmp, err := os.CreateTemp(filepath.Dir(c.path), filepath.Base(c.path)+".*.tmp")
+	if err != nil {
+		return err
+	}
+	_, writeErr := tmp.Write(data)
+	closeErr := tmp.Close()
+	if err := errors.Join(writeErr, closeErr); err != nil {
+		_ = os.Remove(tmp.Name()) //nolint:errcheck // best-effort cleanup of temp file
+		return err
+	}
+
+	return os.Rename(tmp.Name(), c.path)
+}
+
+// fingerprint returns the stat values that identify a blueprint's current state
+func fingerprint(blueprintPath string) Fingerprint {
+	info, err := os.Stat(blueprintPath)
+	if err != nil {
+		return Fingerprint{}
+	}
+	dirInfo, err := os.Stat(filepath.Dir(blueprintPath))
+	if err != nil {
+		return Fingerprint{}
+	}
+	return Fingerprint{
+		modTime:    info.ModTime().UnixNano(),
+		size:       info.Size(),
+		dirModTime: dirInfo.ModTime().UnixNano(),
+		known:      true,
+	}
+}
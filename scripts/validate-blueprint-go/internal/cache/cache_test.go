@@ -0,0 +1,153 @@
+package cache
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeBlueprint creates a blueprint file in a fresh temp directory
+func writeBlueprint(t *testing.T, content string) string {
+	t.Helper()
+	path := filepath.Join(t.TempDir(), "blueprint.yaml")
+	require.NoError(t, os.WriteFile(path, []byte(content), 0o644))
+	return path
+}
+
+// store records a result under the blueprint's current fingerprint
+func store(t *testing.T, c *Cache, bp string, success bool, output []byte) {
+	t.Helper()
+	_, fp, _ := c.Lookup(bp)
+	c.Store(bp, fp, success, output)
+}
+
+func TestCacheLookup(t *testing.T) {
+	t.Parallel()
+
+	t.Run("hit for unchanged file", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+
+		store(t, c, bp, true, []byte("OK\n"))
+		entry, _, ok := c.Lookup(bp)
+
+		require.True(t, ok)
+		assert.True(t, entry.Success)
+		assert.Equal(t, "OK\n", entry.Output)
+	})
+
+	t.Run("miss for unknown file", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+
+		_, _, ok := c.Lookup(bp)
+
+		assert.False(t, ok)
+	})
+
+	t.Run("miss after file changes", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+		store(t, c, bp, true, nil)
+
+		require.NoError(t, os.WriteFile(bp, []byte("blueprint: {name: changed}\n"), 0o644))
+		_, _, ok := c.Lookup(bp)
+
+		assert.False(t, ok)
+	})
+
+	t.Run("miss after sibling file is added", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+		store(t, c, bp, true, nil)
+
+		// Force a distinct directory mtime regardless of filesystem timestamp granularity
+		readme := filepath.Join(filepath.Dir(bp), "README.md")
+		require.NoError(t, os.WriteFile(readme, []byte("# Test\n"), 0o644))
+		future := time.Now().Add(time.Hour)
+		require.NoError(t, os.Chtimes(filepath.Dir(bp), future, future))
+		_, _, ok := c.Lookup(bp)
+
+		assert.False(t, ok)
+	})
+}
+
+func TestCacheStoreFingerprint(t *testing.T) {
+	t.Parallel()
+
+	t.Run("edit during validation invalidates the entry", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+
+		_, fp, ok := c.Lookup(bp)
+		require.False(t, ok)
+		require.NoError(t, os.WriteFile(bp, []byte("blueprint: {name: edited}\n"), 0o644))
+		c.Store(bp, fp, true, nil)
+		_, _, ok = c.Lookup(bp)
+
+		assert.False(t, ok)
+	})
+
+	t.Run("unknown fingerprint is not stored", func(t *testing.T) {
+		t.Parallel()
+		bp := filepath.Join(t.TempDir(), "missing.yaml")
+		c := Load(filepath.Join(t.TempDir(), "results.json"), "1.0.0")
+
+		_, fp, ok := c.Lookup(bp)
+		require.False(t, ok)
+		c.Store(bp, fp, true, nil)
+
+		assert.Empty(t, c.entries)
+	})
+}
+
+func TestCacheSaveAndLoad(t *testing.T) {
+	t.Parallel()
+
+	t.Run("round trip", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		cachePath := filepath.Join(t.TempDir(), "nested", "results.json")
+
+		c := Load(cachePath, "1.0.0")
+		store(t, c, bp, false, []byte("FAIL\n"))
+		require.NoError(t, c.Save())
+
+		entry, _, ok := Load(cachePath, "1.0.0").Lookup(bp)
+		require.True(t, ok)
+		assert.False(t, entry.Success)
+		assert.Equal(t, "FAIL\n", entry.Output)
+	})
+
+	t.Run("version mismatch discards entries", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		cachePath := filepath.Join(t.TempDir(), "results.json")
+
+		c := Load(cachePath, "1.0.0")
+		store(t, c, bp, true, nil)
+		require.NoError(t, c.Save())
+
+		_, _, ok := Load(cachePath, "2.0.0").Lookup(bp)
+		assert.False(t, ok)
+	})
+
+	t.Run("corrupt file yields empty cache", func(t *testing.T) {
+		t.Parallel()
+		bp := writeBlueprint(t, "blueprint: {}\n")
+		cachePath := filepath.Join(t.TempDir(), "results.json")
+		require.NoError(t, os.WriteFile(cachePath, []byte("{not json"), 0o644))
+
+		_, _, ok := Load(cachePath, "1.0.0").Lookup(bp)
+		assert.False(t, ok)
+	})
+}
@@ -84,6 +84,7 @@ var (
 // Re-export traversal utilities
 var (
 	TraverseValue  = validators.TraverseValue
+	WalkStrings    = validators.WalkStrings
 	CollectStrings = validators.CollectStrings
 	TraverseMaps   = validators.TraverseMaps
 )
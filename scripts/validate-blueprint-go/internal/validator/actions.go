@@ -5,6 +5,16 @@ import (
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
+// workItem is a pending node on an action or condition traversal work stack
+type workItem struct {
+	node interface{}
+	path string
+	// conditions marks node as a condition list nested in an action
+	conditions bool
+	// err is reported when the item is reached, keeping it in document order
+	err *errs.Error
+}
+
 // ValidateActions validates action definitions
 func (v *BlueprintValidator) ValidateActions() {
 	actions, ok := v.Data["action"]
@@ -15,22 +25,54 @@ func (v *BlueprintValidator) ValidateActions() {
 	v.validateActionList(actions, "action")
 }
 
-// validateActionList validates a list of actions
-// Uses common path building for consistency.
+// validateActionList validates a list of actions and everything nested under them.
+// Uses an explicit work stack instead of recursion; nodes are visited and
+// reported in the same order as a recursive walk in document order.
 func (v *BlueprintValidator) validateActionList(actions interface{}, path string) {
-	switch a := actions.(type) {
-	case []interface{}:
-		for i, action := range a {
-			v.validateActionList(action, common.IndexPath(path, i))
+	// Input refs are collected in one walk over the whole value; it already
+	// covers every nested sequence, so nested actions are not walked again
+	common.WalkStrings(actions, v.CollectInputRefs)
+
+	stack := []workItem{{node: actions, path: path}}
+
+	for len(stack) > 0 {
+		item := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+
+		if item.err != nil {
+			v.AddTypedError(item.err)
+			continue
+		}
+		if item.conditions {
+			v.validateConditionList(item.node, item.path)
+			continue
+		}
+
+		var children []workItem
+		switch a := item.node.(type) {
+		case []interface{}:
+			children = make([]workItem, len(a))
+			for i, action := range a {
+				children[i] = workItem{node: action, path: common.IndexPath(item.path, i)}
+			}
+		case RawData:
+			children = v.checkAction(a, item.path)
+		}
+
+		// Push in reverse so children are popped in document order
+		for i := len(children) - 1; i >= 0; i-- {
+			stack = append(stack, children[i])
 		}
-	case RawData:
-		v.validateSingleAction(a, path)
 	}
 }
 
-// validateSingleAction validates a single action
+// checkAction validates a single action node and returns, in document order,
+// the nested conditions and action sequences (choose/if/repeat) that still
+// need to be validated along with the structural errors found between them.
 // Uses common service format validation and nil checking.
-func (v *BlueprintValidator) validateSingleAction(action RawData, path string) {
+func (v *BlueprintValidator) checkAction(action RawData, path string) []workItem {
+	var nested []workItem
+
 	// Check for service call
 	if service, ok := common.TryGetString(action, "service"); ok {
 		// Validate service format using common validator
@@ -53,10 +95,10 @@ func (v *BlueprintValidator) validateSingleAction(action RawData, path string) {
 			choicePath := common.IndexPath(choosePath, i)
 			if choiceMap, ok := choice.(RawData); ok {
 				if conditions, ok := choiceMap["conditions"]; ok {
-					v.validateConditionList(conditions, common.JoinPath(choicePath, "conditions"))
+					nested = append(nested, workItem{node: conditions, path: common.JoinPath(choicePath, "conditions"), conditions: true})
 				}
 				if sequence, ok := choiceMap["sequence"]; ok {
-					v.validateActionList(sequence, common.JoinPath(choicePath, "sequence"))
+					nested = append(nested, workItem{node: sequence, path: common.JoinPath(choicePath, "sequence")})
 				}
 			}
 		}
@@ -65,12 +107,12 @@ func (v *BlueprintValidator) validateSingleAction(action RawData, path string) {
 	// Check for if/then/else
 	if _, hasIf := action["if"]; hasIf {
 		if thenAction, ok := action["then"]; ok {
-			v.validateActionList(thenAction, common.JoinPath(path, "then"))
+			nested = append(nested, workItem{node: thenAction, path: common.JoinPath(path, "then")})
 		} else {
-			v.AddTypedError(errs.ErrInvalidAction(path, "'if' requires 'then'"))
+			nested = append(nested, workItem{err: errs.ErrInvalidAction(path, "'if' requires 'then'")})
 		}
 		if elseAction, ok := action["else"]; ok {
-			v.validateActionList(elseAction, common.JoinPath(path, "else"))
+			nested = append(nested, workItem{node: elseAction, path: common.JoinPath(path, "else")})
 		}
 	}
 
@@ -78,12 +120,11 @@ func (v *BlueprintValidator) validateSingleAction(action RawData, path string) {
 	if repeat, ok := common.TryGetMap(action, "repeat"); ok {
 		repeatPath := common.JoinPath(path, "repeat")
 		if sequence, ok := repeat["sequence"]; ok {
-			v.validateActionList(sequence, common.JoinPath(repeatPath, "sequence"))
+			nested = append(nested, workItem{node: sequence, path: common.JoinPath(repeatPath, "sequence")})
 		} else {
-			v.AddTypedError(errs.ErrMissingField(repeatPath, "sequence"))
+			nested = append(nested, workItem{err: errs.ErrMissingField(repeatPath, "sequence")})
 		}
 	}
 
-	// Collect input refs from action
-	v.CollectInputRefsFromMap(action)
+	return nested
 }
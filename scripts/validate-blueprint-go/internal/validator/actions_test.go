@@ -4,6 +4,7 @@ import (
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 
 	"github.com/home-assistant-blueprints/testfixtures"
 )
@@ -133,7 +134,7 @@ func TestValidateSingleAction(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
 			v := New("test.yaml")
-			v.validateSingleAction(tt.action, "action[0]")
+			v.validateActionList(tt.action, "action[0]")
 
 			assert.Len(t, v.Errors, tt.expectedErrors, "Errors: %v", v.Errors)
 			assert.Len(t, v.Warnings, tt.expectedWarnings, "Warnings: %v", v.Warnings)
@@ -192,13 +193,42 @@ func TestValidateChooseAction(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
 			v := New("test.yaml")
-			v.validateSingleAction(tt.action, "action[0]")
+			v.validateActionList(tt.action, "action[0]")
 
 			assert.Len(t, v.Errors, tt.expectedErrors, "Errors: %v", v.Errors)
 		})
 	}
 }
 
+func TestChooseReportOrder(t *testing.T) {
+	t.Parallel()
+
+	action := testfixtures.ChooseAction(
+		testfixtures.ChooseOption(
+			[]testfixtures.Map{{"condition": "bogus_first"}},
+			[]testfixtures.Map{testfixtures.ServiceCall("first_service")},
+		),
+		testfixtures.ChooseOption(
+			[]testfixtures.Map{{"condition": "bogus_second"}},
+			[]testfixtures.Map{testfixtures.ServiceCall("second_service")},
+		),
+	)
+
+	v := New("test.yaml")
+	v.validateActionList(action, "action[0]")
+
+	// Each choice's conditions are reported before its sequence, choice by choice
+	require.Len(t, v.Warnings, 4, "Warnings: %v", v.Warnings)
+	assert.Contains(t, v.Warnings[0], "action[0].choose[0].conditions[0]")
+	assert.Contains(t, v.Warnings[0], "bogus_first")
+	assert.Contains(t, v.Warnings[1], "action[0].choose[0].sequence[0]")
+	assert.Contains(t, v.Warnings[1], "first_service")
+	assert.Contains(t, v.Warnings[2], "action[0].choose[1].conditions[0]")
+	assert.Contains(t, v.Warnings[2], "bogus_second")
+	assert.Contains(t, v.Warnings[3], "action[0].choose[1].sequence[0]")
+	assert.Contains(t, v.Warnings[3], "second_service")
+}
+
 func TestValidateIfThenElseAction(t *testing.T) {
 	t.Parallel()
 
@@ -239,7 +269,7 @@ func TestValidateIfThenElseAction(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
 			v := New("test.yaml")
-			v.validateSingleAction(tt.action, "action[0]")
+			v.validateActionList(tt.action, "action[0]")
 
 			assert.Len(t, v.Errors, tt.expectedErrors, "Errors: %v", v.Errors)
 		})
@@ -293,7 +323,7 @@ func TestValidateRepeatAction(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
 			v := New("test.yaml")
-			v.validateSingleAction(tt.action, "action[0]")
+			v.validateActionList(tt.action, "action[0]")
 
 			assert.Len(t, v.Errors, tt.expectedErrors, "Errors: %v", v.Errors)
 		})
@@ -314,7 +344,7 @@ func TestActionInputRefCollection(t *testing.T) {
 		},
 	}
 
-	v.validateSingleAction(action, "action[0]")
+	v.validateActionList(action, "action[0]")
 
 	// Check that input refs were collected
 	assert.True(t, v.UsedInputs["my_service"])
@@ -353,3 +383,81 @@ func TestNestedActionValidation(t *testing.T) {
 	// All nested structures should be validated without errors
 	assert.Empty(t, v.Errors)
 }
+
+func TestDeeplyNestedActionValidation(t *testing.T) {
+	t.Parallel()
+
+	// Build a deep repeat chain ending in an invalid if block
+	const depth = 200
+	var action interface{} = testfixtures.Map{"if": testfixtures.List{}}
+	for range depth {
+		action = testfixtures.Map{"repeat": testfixtures.Map{"count": 1, "sequence": testfixtures.List{action}}}
+	}
+
+	v := New("test.yaml")
+	v.Data = testfixtures.Map{"action": testfixtures.List{action}}
+	v.ValidateActions()
+
+	require.Len(t, v.Errors, 1)
+	assert.Contains(t, v.Errors[0], "'if' requires 'then'")
+
+	t.Run("errors reported in document order", func(t *testing.T) {
+		t.Parallel()
+		v := New("test.yaml")
+		v.Data = testfixtures.Map{
+			"action": testfixtures.List{
+				testfixtures.Map{"repeat": testfixtures.Map{"count": 1}},
+				testfixtures.Map{"if": testfixtures.List{}},
+			},
+		}
+		v.ValidateActions()
+
+		require.Len(t, v.Errors, 2)
+		assert.Contains(t, v.Errors[0], "action[0].repeat")
+		assert.Contains(t, v.Errors[1], "'if' requires 'then'")
+	})
+}
+
+func TestNestedActionInputRefCollection(t *testing.T) {
+	t.Parallel()
+
+	v := New("test.yaml")
+	v.Data = testfixtures.Map{
+		"action": testfixtures.List{
+			testfixtures.Map{
+				"repeat": testfixtures.Map{
+					"count": testfixtures.InputRef("repeat_count"),
+					"sequence": testfixtures.List{
+						testfixtures.Map{
+							"if":   testfixtures.List{testfixtures.Map{"condition": "state", "entity_id": testfixtures.InputRef("sensor")}},
+							"then": testfixtures.List{testfixtures.Map{"service": testfixtures.InputRef("nested_service")}},
+						},
+					},
+				},
+			},
+		},
+	}
+
+	v.ValidateActions()
+
+	assert.True(t, v.UsedInputs["repeat_count"])
+	assert.True(t, v.UsedInputs["sensor"])
+	assert.True(t, v.UsedInputs["nested_service"])
+}
+
+func TestActionListInListInputRefCollection(t *testing.T) {
+	t.Parallel()
+
+	v := New("test.yaml")
+	v.Data = testfixtures.Map{
+		"action": testfixtures.List{
+			testfixtures.List{
+				testfixtures.Map{"service": testfixtures.InputRef("inner_service")},
+			},
+		},
+	}
+
+	v.ValidateActions()
+
+	assert.True(t, v.UsedInputs["inner_service"])
+}
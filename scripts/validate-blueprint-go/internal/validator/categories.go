@@ -101,7 +101,7 @@ type CategorizedError struct {
 // String returns a formatted string representation of the error
 func (e CategorizedError) String() string {
 	if e.Path != "" {
-		return fmt.Sprintf("%s: %s", e.Path, e.Message)
+		return e.Path + ": " + e.Message
 	}
 	return e.Message
 }
@@ -109,9 +109,9 @@ func (e CategorizedError) String() string {
 // FullString returns a string with category prefix
 func (e CategorizedError) FullString() string {
 	if e.Path != "" {
-		return fmt.Sprintf("[%s] %s: %s", e.Category.String(), e.Path, e.Message)
+		return "[" + e.Category.String() + "] " + e.Path + ": " + e.Message
 	}
-	return fmt.Sprintf("[%s] %s", e.Category.String(), e.Message)
+	return "[" + e.Category.String() + "] " + e.Message
 }
 
 // CategorizedWarning represents a validation warning with its category
@@ -124,7 +124,7 @@ type CategorizedWarning struct {
 // String returns a formatted string representation of the warning
 func (w CategorizedWarning) String() string {
 	if w.Path != "" {
-		return fmt.Sprintf("%s: %s", w.Path, w.Message)
+		return w.Path + ": " + w.Message
 	}
 	return w.Message
 }
@@ -132,9 +132,9 @@ func (w CategorizedWarning) String() string {
 // FullString returns a string with category prefix
 func (w CategorizedWarning) FullString() string {
 	if w.Path != "" {
-		return fmt.Sprintf("[%s] %s: %s", w.Category.String(), w.Path, w.Message)
+		return "[" + w.Category.String() + "] " + w.Path + ": " + w.Message
 	}
-	return fmt.Sprintf("[%s] %s", w.Category.String(), w.Message)
+	return "[" + w.Category.String() + "] " + w.Message
 }
 
 // ErrorsByCategory groups errors by their category
@@ -253,6 +253,10 @@ func FormatCategorySummary(errors []CategorizedError, warnings []CategorizedWarn
 	yellow := color.New(color.FgYellow).SprintFunc()
 	cyan := color.New(color.FgCyan).SprintFunc()
 
+	// Bullet prefixes are colored once rather than per line
+	errBullet := "  " + red("*") + " "
+	warnBullet := "  " + yellow("*") + " "
+
 	if showCategories && len(errors) > 0 {
 		// Group errors by category
 		grouped := ErrorsByCategory(errors)
@@ -269,7 +273,7 @@ func FormatCategorySummary(errors []CategorizedError, warnings []CategorizedWarn
 			catErrs := grouped[cat]
 			fmt.Fprintf(&sb, "%s %s ERRORS (%d):\n", red("X"), cyan(cat.String()), len(catErrs))
 			for _, err := range catErrs {
-				fmt.Fprintf(&sb, "  %s %s\n", red("*"), err.String())
+				sb.WriteString(errBullet + err.String() + "\n")
 			}
 			sb.WriteString("\n")
 		}
@@ -277,7 +281,7 @@ func FormatCategorySummary(errors []CategorizedError, warnings []CategorizedWarn
 		// Flat error display
 		fmt.Fprintf(&sb, "%s ERRORS:\n", red("X"))
 		for _, err := range errors {
-			fmt.Fprintf(&sb, "  %s %s\n", red("*"), err.String())
+			sb.WriteString(errBullet + err.String() + "\n")
 		}
 		sb.WriteString("\n")
 	}
@@ -298,7 +302,7 @@ func FormatCategorySummary(errors []CategorizedError, warnings []CategorizedWarn
 			warns := grouped[cat]
 			fmt.Fprintf(&sb, "%s %s WARNINGS (%d):\n", yellow("!"), cyan(cat.String()), len(warns))
 			for _, warn := range warns {
-				fmt.Fprintf(&sb, "  %s %s\n", yellow("*"), warn.String())
+				sb.WriteString(warnBullet + warn.String() + "\n")
 			}
 			sb.WriteString("\n")
 		}
@@ -306,7 +310,7 @@ func FormatCategorySummary(errors []CategorizedError, warnings []CategorizedWarn
 		// Flat warning display
 		fmt.Fprintf(&sb, "%s WARNINGS:\n", yellow("!"))
 		for _, warn := range warnings {
-			fmt.Fprintf(&sb, "  %s %s\n", yellow("*"), warn.String())
+			sb.WriteString(warnBullet + warn.String() + "\n")
 		}
 		sb.WriteString("\n")
 	}
@@ -1,8 +1,6 @@
 package validator
 
 import (
-	"slices"
-
 	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/common"
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
@@ -17,43 +15,55 @@ func (v *BlueprintValidator) ValidateConditions() {
 	v.validateConditionList(conditions, "condition")
 }
 
-// validateConditionList validates a list of conditions
-// Uses common path building for consistency.
+// validateConditionList validates a list of conditions and everything nested under them.
+// Uses an explicit work stack instead of recursion; each condition is checked
+// before the conditions nested under it, in document order.
 func (v *BlueprintValidator) validateConditionList(conditions interface{}, path string) {
-	switch cond := conditions.(type) {
-	case []interface{}:
-		for i, c := range cond {
-			v.validateConditionList(c, common.IndexPath(path, i))
+	stack := []workItem{{node: conditions, path: path}}
+
+	for len(stack) > 0 {
+		item := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+
+		switch cond := item.node.(type) {
+		case []interface{}:
+			// Push in reverse so conditions are popped in document order
+			for i := len(cond) - 1; i >= 0; i-- {
+				stack = append(stack, workItem{node: cond[i], path: common.IndexPath(item.path, i)})
+			}
+		case RawData:
+			if nested, ok := v.checkCondition(cond, item.path); ok {
+				stack = append(stack, nested)
+			}
 		}
-	case RawData:
-		v.validateSingleCondition(cond, path)
 	}
 }
 
-// validateSingleCondition validates a single condition
+// checkCondition validates a single condition node and returns the nested
+// and/or/not conditions that still need to be validated, if any.
 // Uses common enum validation for condition types.
-func (v *BlueprintValidator) validateSingleCondition(condition RawData, path string) {
+func (v *BlueprintValidator) checkCondition(condition RawData, path string) (workItem, bool) {
 	// Check for condition type
 	condType, hasCondition := condition["condition"].(string)
 	if !hasCondition {
 		// Shorthand condition (e.g., just entity_id without condition key)
 		if _, hasEntityID := condition["entity_id"]; hasEntityID {
-			return // Valid shorthand
+			return workItem{}, false // Valid shorthand
 		}
 		v.AddTypedWarning(errs.ErrMissingConditionType(path))
-		return
+		return workItem{}, false
 	}
 
-	// Validate condition type using common enum validation pattern
-	isValid := slices.Contains(ValidConditionTypes, condType)
-	if !isValid {
+	// Validate condition type with a set lookup
+	if !ValidConditionTypes[condType] {
 		v.AddTypedWarning(errs.Create(errs.CodeUnknownConditionType).WithPath(path).WithMessagef("Unknown condition type '%s'", condType))
 	}
 
 	// Validate nested conditions for and/or/not
 	if condType == "and" || condType == "or" || condType == "not" {
 		if conditions, ok := condition["conditions"]; ok {
-			v.validateConditionList(conditions, common.JoinPath(path, "conditions"))
+			return workItem{node: conditions, path: common.JoinPath(path, "conditions")}, true
 		}
 	}
+	return workItem{}, false
 }
@@ -4,6 +4,7 @@ import (
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 
 	"github.com/home-assistant-blueprints/testfixtures"
 )
@@ -164,7 +165,7 @@ func TestValidateSingleCondition(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
 			v := New("test.yaml")
-			v.validateSingleCondition(tt.condition, "condition[0]")
+			v.validateConditionList(tt.condition, "condition[0]")
 
 			assert.Len(t, v.Errors, tt.expectedErrors, "Errors: %v", v.Errors)
 			assert.Len(t, v.Warnings, tt.expectedWarnings, "Warnings: %v", v.Warnings)
@@ -223,10 +224,29 @@ func TestConditionWithInvalidNestedConditions(t *testing.T) {
 		},
 	)
 
-	v.validateSingleCondition(condition, "condition")
+	v.validateConditionList(condition, "condition")
 
 	// Should have 1 warning for unknown condition type
 	assert.Empty(t, v.Errors)
 	assert.Len(t, v.Warnings, 1)
 	assert.Contains(t, v.Warnings[0], "Unknown condition type")
 }
+
+func TestDeeplyNestedConditionValidation(t *testing.T) {
+	t.Parallel()
+
+	// Build a deep not chain ending in an unknown condition type
+	const depth = 200
+	var condition interface{} = testfixtures.Map{"condition": "unknown_type"}
+	for range depth {
+		condition = testfixtures.Map{"condition": "not", "conditions": testfixtures.List{condition}}
+	}
+
+	v := New("test.yaml")
+	v.Data = testfixtures.Map{"condition": testfixtures.List{condition, testfixtures.Map{"value_template": "{{ true }}"}}}
+	v.ValidateConditions()
+
+	require.Len(t, v.Warnings, 2)
+	assert.Contains(t, v.Warnings[0], "Unknown condition type")
+	assert.Contains(t, v.Warnings[1], "condition[1]")
+}
@@ -1,15 +1,16 @@
 // Package validator provides comprehensive validation for Home Assistant Blueprint files.
 package validator
 
-import "regexp"
-
 // ValidModes are the valid automation modes
 var ValidModes = []string{"single", "restart", "queued", "parallel"}
 
+// ValidDomains are the valid blueprint domains
+var ValidDomains = []string{"automation", "script"}
+
 // ValidConditionTypes are the valid condition types
-var ValidConditionTypes = []string{
-	"and", "or", "not", "state", "numeric_state", "template",
-	"time", "zone", "trigger", "sun", "device",
+var ValidConditionTypes = map[string]bool{
+	"and": true, "or": true, "not": true, "state": true, "numeric_state": true, "template": true,
+	"time": true, "zone": true, "trigger": true, "sun": true, "device": true,
 }
 
 // ValidSelectorTypes are the valid input selector types
@@ -31,21 +32,21 @@ var RequiredBlueprintKeys = []string{"name", "description", "domain", "input"}
 // RequiredRootKeys are required at the root level
 var RequiredRootKeys = []string{"blueprint", "trigger", "action"}
 
-// HysteresisPattern defines a pattern pair for hysteresis validation
+// HysteresisPattern defines an input name suffix pair for hysteresis validation
 type HysteresisPattern struct {
-	OnPattern   *regexp.Regexp
-	OffPattern  string
+	OnSuffix    string
+	OffSuffix   string
 	Description string
 }
 
 // HysteresisPatterns for detecting hysteresis configuration issues
 var HysteresisPatterns = []HysteresisPattern{
-	{regexp.MustCompile(`(.*)_on$`), "${1}_off", "threshold"},
-	{regexp.MustCompile(`(.*)_high$`), "${1}_low", "boundary"},
-	{regexp.MustCompile(`(.*)_upper$`), "${1}_lower", "limit"},
-	{regexp.MustCompile(`(.*)_start$`), "${1}_stop", "trigger point"},
-	{regexp.MustCompile(`(.*)_enable$`), "${1}_disable", "activation point"},
-	{regexp.MustCompile(`delta_on$`), "delta_off", "delta threshold"},
+	{"_on", "_off", "threshold"},
+	{"_high", "_low", "boundary"},
+	{"_upper", "_lower", "limit"},
+	{"_start", "_stop", "trigger point"},
+	{"_enable", "_disable", "activation point"},
+	{"delta_on", "delta_off", "delta threshold"},
 }
 
 // Jinja2Builtins are built-in Jinja2/HA template functions that shouldn't trigger undefined warnings
@@ -18,6 +18,10 @@ type ValidationContext struct {
 	// Use TypedData for type-safe access to blueprint fields.
 	Data RawData
 
+	// Content holds the raw file bytes read by LoadYAML so later checks can
+	// reuse them instead of reading the file again. Nil when Data was set directly.
+	Content []byte
+
 	// TypedData provides strongly-typed access to blueprint fields.
 	// This is populated alongside Data for gradual migration to type-safe code.
 	TypedData *BlueprintData
@@ -261,6 +265,7 @@ func (ctx *ValidationContext) Clone() *ValidationContext {
 		CategorizedErrors:   make([]CategorizedError, len(ctx.CategorizedErrors)),
 		CategorizedWarnings: make([]CategorizedWarning, len(ctx.CategorizedWarnings)),
 		Data:                ctx.Data,      // Shared reference
+		Content:             ctx.Content,   // Shared reference
 		TypedData:           ctx.TypedData, // Shared reference
 		DefinedInputs:       make(map[string]bool),
 		UsedInputs:          make(map[string]bool),
@@ -62,6 +62,38 @@ func TestValidationContextReset(t *testing.T) {
 	assert.NotNil(t, ctx.Data)
 }
 
+func TestValidationContextResetAllocatesFresh(t *testing.T) {
+	t.Parallel()
+
+	t.Run("previous results are kept by their holders", func(t *testing.T) {
+		t.Parallel()
+		ctx := NewValidationContext()
+		ctx.Errors = append(ctx.Errors, "error1")
+		ctx.DefinedInputs["input1"] = true
+		heldErrors := ctx.Errors
+		heldInputs := ctx.DefinedInputs
+
+		ctx.Reset()
+		ctx.Errors = append(ctx.Errors, "error2")
+		ctx.DefinedInputs["input2"] = true
+
+		assert.Equal(t, []string{"error1"}, heldErrors)
+		assert.Equal(t, map[string]bool{"input1": true}, heldInputs)
+	})
+
+	t.Run("zero value context is usable after reset", func(t *testing.T) {
+		t.Parallel()
+		ctx := &ValidationContext{}
+
+		ctx.Reset()
+
+		assert.NotPanics(t, func() {
+			ctx.DefinedInputs["input1"] = true
+			ctx.NonzeroDefaultVars["var1"] = true
+		})
+	})
+}
+
 func TestValidationContextHasErrors(t *testing.T) {
 	t.Parallel()
 
@@ -52,16 +52,13 @@ func (v *BlueprintValidator) CollectInputRefs(value string) {
 	}
 }
 
-// CollectInputRefsFromMap recursively collects !input references from a map
-// Uses common.TraverseValue for consistent traversal.
+// CollectInputRefsFromMap collects !input references from every string in a map.
+// Uses common.WalkStrings, which builds no paths for the values it visits.
 func (v *BlueprintValidator) CollectInputRefsFromMap(m RawData) {
-	common.TraverseValue(m, "", func(value interface{}, _ string) bool {
-		if s, ok := value.(string); ok {
-			if inputName := common.ExtractInputRef(s); inputName != "" {
-				v.UsedInputs[inputName] = true
-			}
+	common.WalkStrings(m, func(s string) {
+		if inputName := common.ExtractInputRef(s); inputName != "" {
+			v.UsedInputs[inputName] = true
 		}
-		return true
 	})
 }
 
@@ -10,21 +10,34 @@ import (
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
-// ValidateHysteresisBoundaries validates hysteresis boundary pairs
+// Variable template patterns are compiled once and shared by every call
+var (
+	nonzeroDefaultPattern = regexp.MustCompile(`\|\s*(?:float|int)\s*\(\s*(\d+\.?\d*)`)
+	joinPattern           = regexp.MustCompile(`\|\s*join\b|join\s*\(`)
+	logCallPattern        = regexp.MustCompile(`log\s*\(\s*(\w+)\s*\)`)
+	logGuardPattern       = regexp.MustCompile(`(\w+)(?:\s*>\s*0|\s+is\s+number)`)
+	sqrtCallPattern       = regexp.MustCompile(`sqrt\s*\(\s*([^)]+)\)`)
+	numberLiteralPattern  = regexp.MustCompile(`^\d+\.?\d*$`)
+	identifierPattern     = regexp.MustCompile(`[a-zA-Z_]\w*`)
+	pythonMethodPattern   = regexp.MustCompile(`\[[^\]]+\]\.(min|max|sum|sort|reverse)\(\)`)
+)
+
+// ValidateHysteresisBoundaries validates hysteresis boundary pairs.
+// Inputs are iterated once, each checked against every suffix pattern.
 func (v *BlueprintValidator) ValidateHysteresisBoundaries() {
-	for _, pattern := range HysteresisPatterns {
-		for inputName := range v.DefinedInputs {
-			matches := pattern.OnPattern.FindStringSubmatch(inputName)
-			if matches == nil {
+	for inputName := range v.DefinedInputs {
+		for _, pattern := range HysteresisPatterns {
+			base, isOn := strings.CutSuffix(inputName, pattern.OnSuffix)
+			if !isOn {
 				continue
 			}
 
 			// Construct the expected OFF input name
 			var offName string
-			if pattern.OffPattern == "delta_off" {
+			if pattern.OffSuffix == "delta_off" {
 				offName = strings.Replace(inputName, "_on", "_off", 1)
 			} else {
-				offName = pattern.OnPattern.ReplaceAllString(inputName, pattern.OffPattern)
+				offName = base + pattern.OffSuffix
 			}
 
 			if !v.DefinedInputs[offName] {
@@ -82,30 +95,23 @@ func (v *BlueprintValidator) ValidateVariables() {
 		return
 	}
 
-	// Track defined variables
-	for name := range variablesMap {
+	// Track defined, join and non-zero default variables, collect input refs
+	// and run per-variable checks in a single pass
+	for name, value := range variablesMap {
 		v.DefinedVariables[name] = true
-	}
 
-	// Pre-pass: collect variables with non-zero defaults
-	defaultPattern := regexp.MustCompile(`\|\s*(?:float|int)\s*\(\s*(\d+\.?\d*)`)
-	for name, value := range variablesMap {
 		if valueStr, ok := value.(string); ok {
-			if matches := defaultPattern.FindStringSubmatch(valueStr); matches != nil {
-				if defaultVal, err := strconv.ParseFloat(matches[1], 64); err == nil && defaultVal > 0 {
-					v.NonzeroDefaultVars[name] = true
+			// The default pattern needs a filter pipe, so values without one skip the regex
+			if strings.IndexByte(valueStr, '|') >= 0 {
+				if matches := nonzeroDefaultPattern.FindStringSubmatch(valueStr); matches != nil {
+					if defaultVal, err := strconv.ParseFloat(matches[1], 64); err == nil && defaultVal > 0 {
+						v.NonzeroDefaultVars[name] = true
+					}
 				}
 			}
-		}
-	}
-
-	// Track join variables and collect input refs
-	joinPattern := regexp.MustCompile(`\|\s*join\b|join\s*\(`)
-	definedVars := make(map[string]bool)
 
-	for name, value := range variablesMap {
-		if valueStr, ok := value.(string); ok {
-			if joinPattern.MatchString(valueStr) {
+			// Both join forms contain the literal; skip the regex when it is absent
+			if strings.Contains(valueStr, "join") && joinPattern.MatchString(valueStr) {
 				v.JoinVariables[name] = true
 			}
 
@@ -115,13 +121,17 @@ func (v *BlueprintValidator) ValidateVariables() {
 			// Check for bare boolean literals
 			v.CheckBareBooleanLiterals(name, valueStr)
 
+			// The math and list method checks only match function calls
+			if strings.IndexByte(valueStr, '(') < 0 {
+				continue
+			}
+
 			// Check for unsafe math operations
 			v.CheckUnsafeMathOperations(name, valueStr)
 
 			// Check for Python-style list methods
 			v.CheckPythonStyleMethods(name, valueStr)
 		}
-		definedVars[name] = true
 	}
 
 	// Check for blueprint_version
@@ -130,80 +140,84 @@ func (v *BlueprintValidator) ValidateVariables() {
 	}
 }
 
-// CheckBareBooleanLiterals checks for bare boolean literals in templates
-// Uses common template detection utilities.
+// CheckBareBooleanLiterals checks for bare boolean literals in templates.
+// Lines are walked in place without splitting the value into a slice.
 func (v *BlueprintValidator) CheckBareBooleanLiterals(varName, value string) {
-	lines := strings.Split(value, "\n")
 	foundBareTrue := false
 	foundBareFalse := false
 
-	for _, line := range lines {
-		stripped := strings.TrimSpace(line)
-		if stripped == "" {
-			continue
-		}
-
-		if stripped != "true" && stripped != "false" {
-			continue
-		}
-
-		// Skip if inside {{ }} blocks using common template detection
-		if common.ContainsTemplate(line) {
-			continue
-		}
+	for rest, more := value, true; more && (!foundBareTrue || !foundBareFalse); {
+		var line string
+		line, rest, more = strings.Cut(rest, "\n")
 
-		varPath := common.JoinPath("variables", varName)
-		if stripped == "true" && !foundBareTrue {
-			foundBareTrue = true
-			v.AddTypedWarning(errs.ErrInvalidTemplate(varPath, "Bare 'true' outputs STRING \"true\", not boolean. Use '{{ true }}' to output actual boolean."))
-		} else if stripped == "false" && !foundBareFalse {
-			foundBareFalse = true
-			v.AddTypedWarning(errs.ErrInvalidTemplate(varPath, "Bare 'false' outputs STRING \"false\", not boolean. The string \"false\" is TRUTHY (non-empty). Use '{{ false }}' instead."))
+		// A line that is exactly a literal cannot also hold a {{ }} or {% %} block
+		switch strings.TrimSpace(line) {
+		case "true":
+			if !foundBareTrue {
+				foundBareTrue = true
+				v.AddTypedWarning(errs.ErrInvalidTemplate(common.JoinPath("variables", varName), "Bare 'true' outputs STRING \"true\", not boolean. Use '{{ true }}' to output actual boolean."))
+			}
+		case "false":
+			if !foundBareFalse {
+				foundBareFalse = true
+				v.AddTypedWarning(errs.ErrInvalidTemplate(common.JoinPath("variables", varName), "Bare 'false' outputs STRING \"false\", not boolean. The string \"false\" is TRUTHY (non-empty). Use '{{ false }}' instead."))
+			}
 		}
 	}
 }
 
-// CheckUnsafeMathOperations checks for potentially unsafe math operations
+// CheckUnsafeMathOperations checks for potentially unsafe math operations.
+// Each scan runs only when its function name occurs in the value at all.
 func (v *BlueprintValidator) CheckUnsafeMathOperations(varName, value string) {
-	varPath := common.JoinPath("variables", varName)
-
-	// Check for log() with potentially non-positive arguments
-	logPattern := regexp.MustCompile(`log\s*\(\s*(\w+)\s*\)`)
-	for _, match := range logPattern.FindAllStringSubmatch(value, -1) {
-		varRef := match[1]
-		guardPattern := regexp.MustCompile(fmt.Sprintf(`%s\s*>\s*0|%s\s+is\s+number`, regexp.QuoteMeta(varRef), regexp.QuoteMeta(varRef)))
-		if !guardPattern.MatchString(value) {
-			v.AddTypedWarning(errs.ErrInvalidTemplate(varPath, fmt.Sprintf("log(%s) may fail if %s <= 0. Consider adding a guard like 'if %s > 0'.", varRef, varRef, varRef)))
+	// Check for log() with potentially non-positive arguments.
+	// Guards are collected in one scan and shared by every log() call.
+	if strings.Contains(value, "log") {
+		if logCalls := logCallPattern.FindAllStringSubmatch(value, -1); logCalls != nil {
+			guards := logGuardPattern.FindAllStringSubmatch(value, -1)
+			for _, match := range logCalls {
+				varRef := match[1]
+				if !isGuarded(guards, varRef) {
+					v.AddTypedWarning(errs.ErrInvalidTemplate(common.JoinPath("variables", varName), fmt.Sprintf("log(%s) may fail if %s <= 0. Consider adding a guard like 'if %s > 0'.", varRef, varRef, varRef)))
+				}
+			}
 		}
 	}
 
-	// Check for sqrt() with potentially negative arguments
-	sqrtPattern := regexp.MustCompile(`sqrt\s*\(\s*([^)]+)\)`)
-	for _, match := range sqrtPattern.FindAllStringSubmatch(value, -1) {
-		arg := strings.TrimSpace(match[1])
-		// Skip literal positive numbers
-		if regexp.MustCompile(`^\d+\.?\d*$`).MatchString(arg) {
-			continue
-		}
+	// Check for sqrt() with potentially negative arguments.
+	// A max(0, x) or abs() guard anywhere in the value silences every call,
+	// so the calls are only scanned when neither guard is present.
+	if strings.Contains(value, "sqrt") && !strings.Contains(value, "max(0,") && !strings.Contains(value, "abs(") {
+		for _, match := range sqrtCallPattern.FindAllStringSubmatch(value, -1) {
+			arg := strings.TrimSpace(match[1])
+			// Skip literal positive numbers
+			if numberLiteralPattern.MatchString(arg) {
+				continue
+			}
 
-		// Check if guarded with max(0, x) or abs()
-		if !strings.Contains(value, "max(0,") && !strings.Contains(value, "abs(") {
-			varMatch := regexp.MustCompile(`([a-zA-Z_]\w*)`).FindStringSubmatch(arg)
-			if varMatch != nil {
-				v.AddTypedWarning(errs.ErrInvalidTemplate(varPath, "sqrt() with potentially negative argument. Consider using sqrt(max(0, value))."))
+			if identifierPattern.MatchString(arg) {
+				v.AddTypedWarning(errs.ErrInvalidTemplate(common.JoinPath("variables", varName), "sqrt() with potentially negative argument. Consider using sqrt(max(0, value))."))
 				break
 			}
 		}
 	}
 }
 
+// isGuarded reports whether any guard match (`x > 0` or `x is number`) covers varRef.
+// A guard word covers varRef when it ends with it, matching an unanchored `varRef\s*>\s*0`.
+func isGuarded(guards [][]string, varRef string) bool {
+	for _, guard := range guards {
+		if strings.HasSuffix(guard[1], varRef) {
+			return true
+		}
+	}
+	return false
+}
+
 // CheckPythonStyleMethods checks for Python-style list methods
 func (v *BlueprintValidator) CheckPythonStyleMethods(varName, value string) {
-	varPath := common.JoinPath("variables", varName)
-
-	// Check for patterns like [a,b].min() which should be [a,b] | min
-	pythonMethodPattern := regexp.MustCompile(`\[[^\]]+\]\.(min|max|sum|sort|reverse)\(\)`)
-	if pythonMethodPattern.MatchString(value) {
-		v.AddTypedError(errs.ErrInvalidTemplate(varPath, "Python-style list method detected. Use Jinja2 filter syntax instead (e.g., '[a,b] | min' not '[a,b].min()')."))
+	// Check for patterns like [a,b].min() which should be [a,b] | min.
+	// Every match contains "].", so values without it skip the regex.
+	if strings.Contains(value, "].") && pythonMethodPattern.MatchString(value) {
+		v.AddTypedError(errs.ErrInvalidTemplate(common.JoinPath("variables", varName), "Python-style list method detected. Use Jinja2 filter syntax instead (e.g., '[a,b] | min' not '[a,b].min()')."))
 	}
 }
@@ -318,6 +318,12 @@ false
 			value:            "this is true story",
 			expectedWarnings: 0,
 		},
+		{
+			name:             "repeated indented literal warns once",
+			varName:          "test",
+			value:            "  true  \n{{ x }}\n\ttrue\n",
+			expectedWarnings: 1,
+		},
 	}
 
 	for _, tt := range tests {
@@ -358,6 +364,24 @@ func TestCheckUnsafeMathOperations(t *testing.T) {
 			value:            "{{ log(value) if value > 0 else 0 }}",
 			expectedWarnings: 0,
 		},
+		{
+			name:             "log with is number guard",
+			varName:          "log_val",
+			value:            "{{ log(value) if value is number else 0 }}",
+			expectedWarnings: 0,
+		},
+		{
+			name:             "log guard for a different variable",
+			varName:          "log_val",
+			value:            "{{ log(value) if other > 0 else 0 }}",
+			expectedWarnings: 1,
+		},
+		{
+			name:             "multiple log calls share guards",
+			varName:          "log_val",
+			value:            "{{ log(a) + log(b) if a > 0 and b > 0 else 0 }}",
+			expectedWarnings: 0,
+		},
 		{
 			name:             "sqrt without guard",
 			varName:          "sqrt_val",
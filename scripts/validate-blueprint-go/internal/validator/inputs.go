@@ -26,31 +26,44 @@ func (v *BlueprintValidator) ValidateInputs() {
 	v.validateInputDict(inputsMap, "blueprint.input")
 }
 
-// validateInputDict recursively validates input definitions
-// Uses common path building utilities for consistency.
+// inputGroup is a pending input mapping on the input traversal work stack
+type inputGroup struct {
+	inputs RawData
+	path   string
+}
+
+// validateInputDict validates input definitions, descending into input groups
+// Uses an explicit work stack for nested groups instead of recursion.
 func (v *BlueprintValidator) validateInputDict(inputs RawData, path string) {
-	for key, value := range inputs {
-		currentPath := common.KeyPath(path, key)
+	stack := []inputGroup{{inputs: inputs, path: path}}
 
-		valueMap, ok, errMsg := common.GetMap(value, currentPath)
-		if !ok {
-			v.AddTypedError(errs.Create(errs.CodeInvalidInput).WithPath(currentPath).WithMessage(errMsg))
-			continue
-		}
+	for len(stack) > 0 {
+		group := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+
+		for key, value := range group.inputs {
+			currentPath := common.KeyPath(group.path, key)
 
-		// Check if this is an input group or actual input
-		if nestedInput, hasNested := valueMap["input"]; hasNested {
-			// This is a group
-			nestedMap, ok, errMsg := common.GetMap(nestedInput, common.JoinPath(currentPath, "input"))
+			valueMap, ok, errMsg := common.GetMap(value, currentPath)
 			if !ok {
-				v.AddTypedError(errs.Create(errs.CodeInvalidInput).WithPath(common.JoinPath(currentPath, "input")).WithMessage(errMsg))
+				v.AddTypedError(errs.Create(errs.CodeInvalidInput).WithPath(currentPath).WithMessage(errMsg))
+				continue
+			}
+
+			// Check if this is an input group or actual input
+			if nestedInput, hasNested := valueMap["input"]; hasNested {
+				// This is a group
+				nestedMap, ok, errMsg := common.GetMap(nestedInput, common.JoinPath(currentPath, "input"))
+				if !ok {
+					v.AddTypedError(errs.Create(errs.CodeInvalidInput).WithPath(common.JoinPath(currentPath, "input")).WithMessage(errMsg))
+				} else {
+					stack = append(stack, inputGroup{inputs: nestedMap, path: currentPath})
+				}
 			} else {
-				v.validateInputDict(nestedMap, currentPath)
+				// This is an actual input definition
+				v.DefinedInputs[key] = true
+				v.validateSingleInput(valueMap, currentPath, key)
 			}
-		} else {
-			// This is an actual input definition
-			v.DefinedInputs[key] = true
-			v.validateSingleInput(valueMap, currentPath, key)
 		}
 	}
 }
@@ -2,73 +2,85 @@ package validator
 
 import (
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"strings"
 
 	"github.com/fatih/color"
 
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
-// ReportResults prints validation results and returns success status
+// ReportResults prints validation results and returns success status.
+// The report is assembled in memory and written with a single call.
 func (v *BlueprintValidator) ReportResults() bool {
-	fmt.Println()
+	var b strings.Builder
+	defer v.emit(&b)
+
+	b.WriteByte('\n')
 
 	green := color.New(color.FgGreen).SprintFunc()
 	red := color.New(color.FgRed).SprintFunc()
 
 	// Use categorized output if we have categorized errors/warnings and grouping is enabled
 	if v.GroupByCategory && (len(v.CategorizedErrors) > 0 || len(v.CategorizedWarnings) > 0) {
-		output := FormatCategorySummary(v.CategorizedErrors, v.CategorizedWarnings, true)
-		fmt.Print(output)
+		b.WriteString(FormatCategorySummary(v.CategorizedErrors, v.CategorizedWarnings, true))
 	} else {
 		// Fall back to legacy flat output
-		v.reportLegacyResults()
+		v.writeLegacyResults(&b)
 	}
 
 	if len(v.Errors) == 0 && len(v.Warnings) == 0 {
-		fmt.Printf("%s Blueprint is valid!\n", green("OK"))
+		fmt.Fprintf(&b, "%s Blueprint is valid!\n", green("OK"))
 		return true
 	}
 
 	if len(v.Errors) == 0 {
-		fmt.Printf("%s Blueprint is valid (with %d warnings)\n", green("OK"), len(v.Warnings))
+		fmt.Fprintf(&b, "%s Blueprint is valid (with %d warnings)\n", green("OK"), len(v.Warnings))
 		return true
 	}
 
 	// Print category summary if we have categorized errors
 	if v.GroupByCategory && len(v.CategorizedErrors) > 0 {
-		v.printCategorySummary()
+		v.writeCategorySummary(&b)
 	}
 
-	fmt.Printf("%s Blueprint validation failed with %d errors\n", red("FAIL"), len(v.Errors))
+	fmt.Fprintf(&b, "%s Blueprint validation failed with %d errors\n", red("FAIL"), len(v.Errors))
 	return false
 }
 
-// reportLegacyResults prints errors and warnings in the legacy flat format
-func (v *BlueprintValidator) reportLegacyResults() {
+// emit writes an assembled report to the validator output in one call
+func (v *BlueprintValidator) emit(b *strings.Builder) {
+	_, _ = io.WriteString(v.output(), b.String()) //nolint:errcheck // best-effort console output
+}
+
+// writeLegacyResults formats errors and warnings in the legacy flat format
+func (v *BlueprintValidator) writeLegacyResults(b *strings.Builder) {
 	red := color.New(color.FgRed).SprintFunc()
 	yellow := color.New(color.FgYellow).SprintFunc()
 
 	if len(v.Errors) > 0 {
-		fmt.Printf("%s ERRORS:\n", red("X"))
+		fmt.Fprintf(b, "%s ERRORS:\n", red("X"))
+		bullet := red("*")
 		for _, err := range v.Errors {
-			fmt.Printf("  %s %s\n", red("*"), err)
+			fmt.Fprintf(b, "  %s %s\n", bullet, err)
 		}
-		fmt.Println()
+		b.WriteByte('\n')
 	}
 
 	if len(v.Warnings) > 0 {
-		fmt.Printf("%s WARNINGS:\n", yellow("!"))
+		fmt.Fprintf(b, "%s WARNINGS:\n", yellow("!"))
+		bullet := yellow("*")
 		for _, warning := range v.Warnings {
-			fmt.Printf("  %s %s\n", yellow("*"), warning)
+			fmt.Fprintf(b, "  %s %s\n", bullet, warning)
 		}
-		fmt.Println()
+		b.WriteByte('\n')
 	}
 }
 
-// printCategorySummary prints a brief summary of errors by category
-func (v *BlueprintValidator) printCategorySummary() {
+// writeCategorySummary formats a brief summary of errors by category
+func (v *BlueprintValidator) writeCategorySummary(b *strings.Builder) {
 	counts := v.ErrorCounts()
 	if len(counts) == 0 {
 		return
@@ -76,40 +88,43 @@ func (v *BlueprintValidator) printCategorySummary() {
 
 	cyan := color.New(color.FgCyan).SprintFunc()
 
-	fmt.Print("Error summary: ")
+	b.WriteString("Error summary: ")
 	first := true
 	for _, cat := range AllCategories() {
 		if count, ok := counts[cat]; ok && count > 0 {
 			if !first {
-				fmt.Print(", ")
+				b.WriteString(", ")
 			}
-			fmt.Printf("%s: %d", cyan(cat.String()), count)
+			fmt.Fprintf(b, "%s: %d", cyan(cat.String()), count)
 			first = false
 		}
 	}
-	fmt.Println()
+	b.WriteByte('\n')
 }
 
 // ReportResultsFlat prints validation results without category grouping
 func (v *BlueprintValidator) ReportResultsFlat() bool {
-	fmt.Println()
+	var b strings.Builder
+	defer v.emit(&b)
+
+	b.WriteByte('\n')
 
 	green := color.New(color.FgGreen).SprintFunc()
 	red := color.New(color.FgRed).SprintFunc()
 
-	v.reportLegacyResults()
+	v.writeLegacyResults(&b)
 
 	if len(v.Errors) == 0 && len(v.Warnings) == 0 {
-		fmt.Printf("%s Blueprint is valid!\n", green("OK"))
+		fmt.Fprintf(&b, "%s Blueprint is valid!\n", green("OK"))
 		return true
 	}
 
 	if len(v.Errors) == 0 {
-		fmt.Printf("%s Blueprint is valid (with %d warnings)\n", green("OK"), len(v.Warnings))
+		fmt.Fprintf(&b, "%s Blueprint is valid (with %d warnings)\n", green("OK"), len(v.Warnings))
 		return true
 	}
 
-	fmt.Printf("%s Blueprint validation failed with %d errors\n", red("FAIL"), len(v.Errors))
+	fmt.Fprintf(&b, "%s Blueprint validation failed with %d errors\n", red("FAIL"), len(v.Errors))
 	return false
 }
 
@@ -125,7 +140,10 @@ func (v *BlueprintValidator) ReportResultsByCategory() bool {
 
 // ReportFilteredResults prints validation results for specific categories only
 func (v *BlueprintValidator) ReportFilteredResults(categories ...ErrorCategory) bool {
-	fmt.Println()
+	var b strings.Builder
+	defer v.emit(&b)
+
+	b.WriteByte('\n')
 
 	green := color.New(color.FgGreen).SprintFunc()
 	red := color.New(color.FgRed).SprintFunc()
@@ -134,21 +152,20 @@ func (v *BlueprintValidator) ReportFilteredResults(categories ...ErrorCategory)
 	filteredWarnings := v.GetWarningsByCategory(categories...)
 
 	if len(filteredErrors) > 0 || len(filteredWarnings) > 0 {
-		output := FormatCategorySummary(filteredErrors, filteredWarnings, true)
-		fmt.Print(output)
+		b.WriteString(FormatCategorySummary(filteredErrors, filteredWarnings, true))
 	}
 
 	if len(filteredErrors) == 0 && len(filteredWarnings) == 0 {
-		fmt.Printf("%s No issues found in selected categories!\n", green("OK"))
+		fmt.Fprintf(&b, "%s No issues found in selected categories!\n", green("OK"))
 		return true
 	}
 
 	if len(filteredErrors) == 0 {
-		fmt.Printf("%s No errors in selected categories (with %d warnings)\n", green("OK"), len(filteredWarnings))
+		fmt.Fprintf(&b, "%s No errors in selected categories (with %d warnings)\n", green("OK"), len(filteredWarnings))
 		return true
 	}
 
-	fmt.Printf("%s Found %d errors in selected categories\n", red("FAIL"), len(filteredErrors))
+	fmt.Fprintf(&b, "%s Found %d errors in selected categories\n", red("FAIL"), len(filteredErrors))
 	return false
 }
 
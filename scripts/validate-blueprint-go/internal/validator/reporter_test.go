@@ -1,6 +1,7 @@
 package validator
 
 import (
+	"bytes"
 	"io"
 	"os"
 	"path/filepath"
@@ -324,6 +325,21 @@ func TestReportFilteredResults(t *testing.T) {
 	})
 }
 
+func TestReportResultsToWriter(t *testing.T) {
+	t.Parallel()
+
+	v := New("test.yaml")
+	var buf bytes.Buffer
+	v.Out = &buf
+	v.AddError("buffered error")
+
+	result := v.ReportResults()
+
+	assert.False(t, result)
+	assert.Contains(t, buf.String(), "buffered error")
+	assert.Contains(t, buf.String(), "FAIL")
+}
+
 func TestDocumentationWarningsAreCategorized(t *testing.T) {
 	t.Parallel()
 
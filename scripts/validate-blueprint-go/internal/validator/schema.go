@@ -9,6 +9,9 @@ import (
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
+// versionPattern matches a version number embedded in a blueprint name
+var versionPattern = regexp.MustCompile(`v?(\d+\.\d+(?:\.\d+)?)`)
+
 // ValidateStructure validates root-level structure
 // Uses common required key validation patterns.
 func (v *BlueprintValidator) ValidateStructure() {
@@ -57,8 +60,7 @@ func (v *BlueprintValidator) ValidateBlueprintSection() {
 
 	// Validate domain using common enum validation
 	if domain, ok := common.TryGetString(blueprintMap, "domain"); ok {
-		validDomains := []string{"automation", "script"}
-		if errMsg := common.ValidateEnumValue(domain, validDomains, "blueprint", "domain"); errMsg != "" {
+		if errMsg := common.ValidateEnumValue(domain, ValidDomains, "blueprint", "domain"); errMsg != "" {
 			v.AddTypedError(errs.NewWithPath(errs.ErrorTypeSchema, "blueprint.domain", errMsg))
 		}
 	}
@@ -116,7 +118,6 @@ func (v *BlueprintValidator) ValidateVersionSync() {
 	versionStr := fmt.Sprintf("%v", blueprintVersion)
 
 	// Check if version in name matches blueprint_version
-	versionPattern := regexp.MustCompile(`v?(\d+\.\d+(?:\.\d+)?)`)
 	nameVersionMatch := versionPattern.FindString(name)
 
 	if nameVersionMatch != "" && !strings.Contains(name, versionStr) {
@@ -1,15 +1,36 @@
 package validator
 
 import (
+	"bytes"
+
 	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/common"
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
+// jinjaDelimiters are the byte sequences that template checks look for
+var jinjaDelimiters = [][]byte{[]byte("{{"), []byte("}}"), []byte("{%"), []byte("%}")}
+
 // ValidateTemplates validates Jinja2 templates throughout the blueprint
 func (v *BlueprintValidator) ValidateTemplates() {
+	// Reuse the raw file content: without any Jinja2 delimiter in the file,
+	// no string value can fail a template check
+	if v.Content != nil && !containsJinjaDelimiter(v.Content) {
+		return
+	}
+
 	v.validateTemplatesInValue(v.Data, "")
 }
 
+// containsJinjaDelimiter reports whether content contains any Jinja2 delimiter
+func containsJinjaDelimiter(content []byte) bool {
+	for _, delim := range jinjaDelimiters {
+		if bytes.Contains(content, delim) {
+			return true
+		}
+	}
+	return false
+}
+
 // validateTemplatesInValue recursively validates templates in a value
 // Uses common.TraverseValue for consistent traversal and common path building.
 func (v *BlueprintValidator) validateTemplatesInValue(value interface{}, path string) {
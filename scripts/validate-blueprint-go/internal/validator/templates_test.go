@@ -263,3 +263,51 @@ func TestComplexTemplateValidation(t *testing.T) {
 
 	assert.Empty(t, v.Errors, "No errors expected for valid templates")
 }
+
+func TestContainsJinjaDelimiter(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name     string
+		content  string
+		expected bool
+	}{
+		{name: "no delimiters", content: "action:\n  - service: light.turn_on\n", expected: false},
+		{name: "expression open", content: "value: \"{{ states('sensor.x') }}\"", expected: true},
+		{name: "stray expression close", content: "value: broken }}", expected: true},
+		{name: "statement block", content: "value: \"{% if x %}on{% endif %}\"", expected: true},
+		{name: "single braces", content: "data: {brightness: 255}", expected: false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			assert.Equal(t, tt.expected, containsJinjaDelimiter([]byte(tt.content)))
+		})
+	}
+}
+
+func TestValidateTemplatesReusesLoadedContent(t *testing.T) {
+	t.Parallel()
+
+	t.Run("file without templates", func(t *testing.T) {
+		t.Parallel()
+		v := New(createTempYAMLFile(t, "action:\n  - service: light.turn_on\n"))
+		assert.True(t, v.LoadYAML())
+		assert.NotEmpty(t, v.Content)
+
+		v.ValidateTemplates()
+
+		assert.Empty(t, v.Errors)
+	})
+
+	t.Run("file with unbalanced template", func(t *testing.T) {
+		t.Parallel()
+		v := New(createTempYAMLFile(t, "variables:\n  value: \"{{ states('sensor.x') \"\n"))
+		assert.True(t, v.LoadYAML())
+
+		v.ValidateTemplates()
+
+		assert.Len(t, v.Errors, 1, "Errors: %v", v.Errors)
+	})
+}
@@ -12,19 +12,16 @@ func (v *BlueprintValidator) ValidateTriggers() {
 		return
 	}
 
-	triggerList, ok := triggers.([]interface{})
-	if !ok {
-		// Single trigger (not a list)
-		if triggerMap, ok := triggers.(RawData); ok {
-			v.validateSingleTrigger(triggerMap, "trigger")
-		}
-		return
-	}
-
-	for i, trigger := range triggerList {
-		if triggerMap, ok := trigger.(RawData); ok {
-			v.validateSingleTrigger(triggerMap, common.IndexPath("trigger", i))
+	switch t := triggers.(type) {
+	case []interface{}:
+		for i, trigger := range t {
+			if triggerMap, ok := trigger.(RawData); ok {
+				v.validateSingleTrigger(triggerMap, common.IndexPath("trigger", i))
+			}
 		}
+	case RawData:
+		// Single trigger (not a list)
+		v.validateSingleTrigger(t, "trigger")
 	}
 }
 
@@ -2,6 +2,8 @@ package validator
 
 import (
 	"fmt"
+	"io"
+	"os"
 
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
@@ -17,6 +19,8 @@ type BlueprintValidator struct {
 	FilePath string
 	// GroupByCategory controls whether errors/warnings are grouped by category in output
 	GroupByCategory bool
+	// Out receives progress and report output; nil means os.Stdout
+	Out io.Writer
 }
 
 // New creates a new validator instance
@@ -41,20 +45,77 @@ func NewWithContext(filePath string, ctx *ValidationContext) *BlueprintValidator
 	}
 }
 
+// Reset prepares the validator to validate another file, truncating and
+// clearing the storage of its ValidationContext in place instead of
+// allocating a new one. Errors, warnings and maps read from the previous
+// run are overwritten by the next one.
+func (v *BlueprintValidator) Reset(filePath string) {
+	ctx := v.ValidationContext
+	ctx.Errors = ctx.Errors[:0]
+	ctx.Warnings = ctx.Warnings[:0]
+	ctx.CategorizedErrors = ctx.CategorizedErrors[:0]
+	ctx.CategorizedWarnings = ctx.CategorizedWarnings[:0]
+	ctx.DefinedInputs = reuseMap(ctx.DefinedInputs)
+	ctx.UsedInputs = reuseMap(ctx.UsedInputs)
+	ctx.InputDefaults = reuseMap(ctx.InputDefaults)
+	ctx.InputSelectors = reuseMap(ctx.InputSelectors)
+	ctx.TypedInputSelectors = reuseMap(ctx.TypedInputSelectors)
+	ctx.EntityInputs = reuseMap(ctx.EntityInputs)
+	ctx.InputDatetimeInputs = reuseMap(ctx.InputDatetimeInputs)
+	ctx.DefinedVariables = reuseMap(ctx.DefinedVariables)
+	ctx.JoinVariables = reuseMap(ctx.JoinVariables)
+	ctx.NonzeroDefaultVars = reuseMap(ctx.NonzeroDefaultVars)
+
+	v.Data = make(RawData)
+	v.Content = nil
+	v.TypedData = nil
+	v.FilePath = filePath
+}
+
+// reuseMap empties m in place, allocating it when it is nil
+func reuseMap[K comparable, V any](m map[K]V) map[K]V {
+	if m == nil {
+		return make(map[K]V)
+	}
+	clear(m)
+	return m
+}
+
 // Context returns the underlying ValidationContext.
 // This provides direct access to the context for advanced use cases.
 func (v *BlueprintValidator) Context() *ValidationContext {
 	return v.ValidationContext
 }
 
+// output returns the writer report output is sent to
+func (v *BlueprintValidator) output() io.Writer {
+	if v.Out == nil {
+		return os.Stdout
+	}
+	return v.Out
+}
+
 // Validate runs all validation checks
 func (v *BlueprintValidator) Validate() bool {
-	fmt.Printf("Validating: %s\n", v.FilePath)
+	_, _ = fmt.Fprintf(v.output(), "Validating: %s\n", v.FilePath) //nolint:errcheck // best-effort console output
 
-	if !v.LoadYAML() {
+	if !v.readFile() {
 		return false
 	}
 
+	if !v.parseYAML() {
+		return false
+	}
+
+	// Files that cannot be blueprints only get the root key and companion
+	// file checks; the section validators have nothing to validate
+	if !looksLikeBlueprint(v.Content) {
+		v.ValidateStructure()
+		v.CheckReadmeExists()
+		v.CheckChangelogExists()
+		return v.ReportResults()
+	}
+
 	v.ValidateStructure()
 	v.ValidateBlueprintSection()
 	v.ValidateMode()
@@ -102,7 +163,7 @@ func (v *BlueprintValidator) AddCategorizedError(category ErrorCategory, path, m
 	})
 	// Also add to legacy Errors slice for backward compatibility
 	if path != "" {
-		v.Errors = append(v.Errors, fmt.Sprintf("%s: %s", path, msg))
+		v.Errors = append(v.Errors, path+": "+msg)
 	} else {
 		v.Errors = append(v.Errors, msg)
 	}
@@ -122,7 +183,7 @@ func (v *BlueprintValidator) AddCategorizedWarning(category ErrorCategory, path,
 	})
 	// Also add to legacy Warnings slice for backward compatibility
 	if path != "" {
-		v.Warnings = append(v.Warnings, fmt.Sprintf("%s: %s", path, msg))
+		v.Warnings = append(v.Warnings, path+": "+msg)
 	} else {
 		v.Warnings = append(v.Warnings, msg)
 	}
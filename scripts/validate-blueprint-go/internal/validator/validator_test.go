@@ -32,6 +32,40 @@ func TestNew(t *testing.T) {
 	assert.NotNil(t, v.NonzeroDefaultVars)
 }
 
+func TestValidatorReset(t *testing.T) {
+	t.Parallel()
+
+	v := NewWithContext("first.yaml", NewValidationContextWithData(testfixtures.MinimalBlueprint()))
+	v.Content = []byte("blueprint: {}\n")
+	v.AddError("stale error")
+	v.AddWarning("stale warning")
+	v.DefinedInputs["stale_input"] = true
+
+	v.Reset("second.yaml")
+
+	assert.Equal(t, "second.yaml", v.FilePath)
+	assert.Empty(t, v.Errors)
+	assert.Empty(t, v.Warnings)
+	assert.Empty(t, v.CategorizedErrors)
+	assert.Empty(t, v.DefinedInputs)
+	assert.Empty(t, v.Data)
+	assert.Nil(t, v.Content)
+	assert.Nil(t, v.TypedData)
+	assert.True(t, v.GroupByCategory)
+
+	t.Run("zero value context", func(t *testing.T) {
+		t.Parallel()
+		v := NewWithContext("first.yaml", &ValidationContext{})
+
+		v.Reset("second.yaml")
+
+		assert.NotPanics(t, func() {
+			v.DefinedInputs["input1"] = true
+			v.NonzeroDefaultVars["var1"] = true
+		})
+	})
+}
+
 func TestAddError(t *testing.T) {
 	t.Parallel()
 
@@ -1,31 +1,85 @@
 package validator
 
 import (
+	"bytes"
 	"os"
-	"regexp"
 
 	"gopkg.in/yaml.v3"
 
 	errs "github.com/home-assistant-blueprints/validate-blueprint-go/internal/errors"
 )
 
+// inputTag is the custom YAML tag Home Assistant uses to reference blueprint inputs
+const inputTag = "!input"
+
+// blueprintKey is the root key every blueprint file must define
+var blueprintKey = []byte("blueprint")
+
 // LoadYAML loads and parses the YAML file
 func (v *BlueprintValidator) LoadYAML() bool {
+	return v.readFile() && v.parseYAML()
+}
+
+// readFile reads the blueprint file into Content
+func (v *BlueprintValidator) readFile() bool {
 	content, err := os.ReadFile(v.FilePath)
 	if err != nil {
 		v.AddTypedError(errs.ErrFileReadError(v.FilePath, err))
 		return false
 	}
+	v.Content = content
+	return true
+}
 
-	// Custom handling for !input tags - replace with placeholder
-	contentStr := string(content)
-	inputRegex := regexp.MustCompile(`!input\s+(\S+)`)
-	contentStr = inputRegex.ReplaceAllString(contentStr, `"!input $1"`)
+// looksLikeBlueprint reports whether content can possibly define a blueprint.
+// A file that never mentions the blueprint key cannot have it at the root,
+// so the section validators can be skipped for it.
+func looksLikeBlueprint(content []byte) bool {
+	return bytes.Contains(content, blueprintKey)
+}
 
-	if err := yaml.Unmarshal([]byte(contentStr), &v.Data); err != nil {
+// parseYAML parses Content into Data
+func (v *BlueprintValidator) parseYAML() bool {
+	var root yaml.Node
+	if err := yaml.Unmarshal(v.Content, &root); err != nil {
+		v.AddTypedError(errs.ErrYAMLSyntax(err))
+		return false
+	}
+
+	// Empty document - nothing to decode
+	if root.Kind == 0 {
+		return true
+	}
+
+	// Custom handling for !input tags - resolve on the node tree so the
+	// parser sees the original text and no regex rewrite pass is needed
+	resolveInputTags(&root)
+
+	if err := root.Decode(&v.Data); err != nil {
 		v.AddTypedError(errs.ErrYAMLSyntax(err))
 		return false
 	}
 
 	return true
 }
+
+// resolveInputTags rewrites `!input name` scalars into plain "!input name" strings
+// so they survive decoding into RawData and can be tracked as input references.
+func resolveInputTags(node *yaml.Node) {
+	if node.Kind == yaml.ScalarNode {
+		if node.Tag == inputTag {
+			node.Tag = "!!str"
+			node.Value = inputTag + " " + node.Value
+		}
+		return
+	}
+
+	// Aliases point at anchored nodes that are resolved where they are defined
+	if node.Kind == yaml.AliasNode {
+		return
+	}
+
+	for _, child := range node.Content {
+		resolveInputTags(child)
+	}
+}
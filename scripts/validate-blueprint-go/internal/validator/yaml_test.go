@@ -1,6 +1,7 @@
 package validator
 
 import (
+	"bytes"
 	"os"
 	"path/filepath"
 	"testing"
@@ -133,6 +134,78 @@ action:
 		assert.True(t, result)
 		assert.Empty(t, v.Errors, "Errors: %v", v.Errors)
 	})
+
+	t.Run("input tags in flow sequences and aliases", func(t *testing.T) {
+		t.Parallel()
+		content := `variables:
+  entities: [!input first_entity, !input second_entity]
+  primary: &primary !input primary_entity
+  fallback: *primary
+`
+		tmpFile := createTempYAMLFile(t, content)
+		defer os.Remove(tmpFile)
+
+		v := New(tmpFile)
+		result := v.LoadYAML()
+
+		require.True(t, result)
+		assert.Empty(t, v.Errors, "Errors: %v", v.Errors)
+		variables, ok := v.Data["variables"].(map[string]interface{})
+		require.True(t, ok)
+		assert.Equal(t, []interface{}{"!input first_entity", "!input second_entity"}, variables["entities"])
+		assert.Equal(t, "!input primary_entity", variables["primary"])
+		assert.Equal(t, "!input primary_entity", variables["fallback"])
+	})
+}
+
+func TestLooksLikeBlueprint(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name     string
+		content  string
+		expected bool
+	}{
+		{name: "blueprint at top", content: "blueprint:\n  name: Test\n", expected: true},
+		{name: "blueprint after comments", content: "# header\n---\nblueprint:\n  name: Test\n", expected: true},
+		{name: "flow style root", content: "{blueprint: {name: Test}}", expected: true},
+		{name: "no blueprint key", content: "automation:\n  - alias: Test\n", expected: false},
+		{name: "empty file", content: "", expected: false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			assert.Equal(t, tt.expected, looksLikeBlueprint([]byte(tt.content)))
+		})
+	}
+}
+
+func TestValidateRejectsNonBlueprint(t *testing.T) {
+	t.Parallel()
+
+	v := New(createTempYAMLFile(t, "automation:\n  - alias: Test\n"))
+	var buf bytes.Buffer
+	v.Out = &buf
+
+	assert.False(t, v.Validate())
+	require.Len(t, v.Errors, 3, "Errors: %v", v.Errors)
+	assert.Contains(t, v.Errors[0], "missing required field: blueprint")
+	assert.Contains(t, v.Errors[1], "missing required field: trigger")
+	assert.Contains(t, v.Errors[2], "missing required field: action")
+	assert.NotEmpty(t, v.Warnings, "README/CHANGELOG checks should still run")
+}
+
+func TestValidateNonBlueprintSyntaxError(t *testing.T) {
+	t.Parallel()
+
+	v := New(createTempYAMLFile(t, "automation: [unclosed\n"))
+	var buf bytes.Buffer
+	v.Out = &buf
+
+	assert.False(t, v.Validate())
+	require.Len(t, v.Errors, 1)
+	assert.NotContains(t, v.Errors[0], "missing required field")
 }
 
 // createTempYAMLFile creates a temporary YAML file for testing
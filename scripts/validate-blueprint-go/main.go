@@ -3,18 +3,23 @@
 // Usage:
 //
 //	validate-blueprint <blueprint.yaml>
-//	validate-blueprint --all
+//	validate-blueprint --all [--cache] [--jobs N] [--fail-fast]
 //	validate-blueprint update [--check]
 package main
 
 import (
+	"bytes"
 	"context"
 	"errors"
 	"fmt"
+	"io"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/fatih/color"
@@ -22,6 +27,7 @@ import (
 
 	"github.com/home-assistant-blueprints/selfupdate"
 
+	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/cache"
 	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/shutdown"
 	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/validator"
 )
@@ -54,6 +60,19 @@ func main() {
 				Aliases: []string{"a"},
 				Usage:   "Validate all blueprints in the repository",
 			},
+			&cli.BoolFlag{
+				Name:  "cache",
+				Usage: "With --all, reuse results for blueprints unchanged since the last cached run",
+			},
+			&cli.IntFlag{
+				Name:    "jobs",
+				Aliases: []string{"j"},
+				Usage:   "With --all, number of blueprints to validate in parallel (0 = one per CPU)",
+			},
+			&cli.BoolFlag{
+				Name:  "fail-fast",
+				Usage: "With --all, stop starting new blueprints after the first failure",
+			},
 		},
 		Action: runValidation,
 		Commands: []*cli.Command{
@@ -85,7 +104,11 @@ func runValidation(ctx context.Context, cmd *cli.Command) error {
 	var success bool
 	switch {
 	case validateAll:
-		success = runValidateAllWithContext(ctx)
+		success = runValidateAllWithContext(ctx, validateAllOptions{
+			useCache: cmd.Bool("cache"),
+			jobs:     cmd.Int("jobs"),
+			failFast: cmd.Bool("fail-fast"),
+		})
 	case args.Len() > 0:
 		success = validateSingle(args.First())
 	default:
@@ -99,38 +122,45 @@ func runValidation(ctx context.Context, cmd *cli.Command) error {
 	return nil
 }
 
+// blueprintSuffixes are the file name suffixes that identify blueprint files
+var blueprintSuffixes = []string{"_pro.yaml", "_pro_blueprint.yaml"}
+
+// isBlueprintFile reports whether a file name matches a blueprint naming pattern
+func isBlueprintFile(name string) bool {
+	if name == "blueprint.yaml" {
+		return true
+	}
+	for _, suffix := range blueprintSuffixes {
+		if strings.HasSuffix(name, suffix) {
+			return true
+		}
+	}
+	return false
+}
+
 // findAllBlueprints finds all blueprint YAML files in the repository
 func findAllBlueprints(basePath string) ([]string, error) {
 	var blueprints []string
-	patterns := []string{"*_pro.yaml", "*_pro_blueprint.yaml", "blueprint.yaml"}
 	excludeDirs := map[string]bool{
 		".git": true, "node_modules": true, "venv": true, ".venv": true, "__pycache__": true,
 	}
 
-	err := filepath.Walk(basePath, func(path string, info os.FileInfo, walkErr error) error {
+	// WalkDir avoids an lstat per entry; names come straight from the directory read
+	err := filepath.WalkDir(basePath, func(path string, d fs.DirEntry, walkErr error) error {
 		if walkErr != nil {
 			return walkErr // Return the actual error instead of nil
 		}
 
-		// Skip excluded directories
-		if info.IsDir() && excludeDirs[info.Name()] {
-			return filepath.SkipDir
-		}
-
-		if info.IsDir() {
+		if d.IsDir() {
+			// Skip excluded directories
+			if excludeDirs[d.Name()] {
+				return filepath.SkipDir
+			}
 			return nil
 		}
 
-		// Check if file matches any pattern
-		for _, pattern := range patterns {
-			matched, matchErr := filepath.Match(pattern, info.Name())
-			if matchErr != nil {
-				continue // Skip invalid patterns
-			}
-			if matched {
-				blueprints = append(blueprints, path)
-				break
-			}
+		if isBlueprintFile(d.Name()) {
+			blueprints = append(blueprints, path)
 		}
 
 		return nil
@@ -149,10 +179,23 @@ func validateSingle(blueprintPath string) bool {
 	return v.Validate()
 }
 
+// validateAllOptions configures a --all run
+type validateAllOptions struct {
+	// useCache replays stored results for unchanged blueprints
+	useCache bool
+	// jobs is the number of parallel workers; 0 means one per CPU
+	jobs int
+	// failFast stops starting new blueprints after the first failure
+	failFast bool
+}
+
 // runValidateAllWithContext validates all blueprints with context support for interruption.
-//
-//nolint:gocyclo // Complexity is acceptable for main orchestration function
-func runValidateAllWithContext(ctx context.Context) bool {
+func runValidateAllWithContext(ctx context.Context, opts validateAllOptions) bool {
+	return validateAll(ctx, findRepoRoot(), opts, os.Stdout)
+}
+
+// findRepoRoot locates the repository root holding the blueprints directory
+func findRepoRoot() string {
 	// Navigate up from scripts/validate-blueprint-go/ to the repo root
 	execPath, err := os.Executable()
 	if err != nil {
@@ -191,64 +234,75 @@ func runValidateAllWithContext(ctx context.Context) bool {
 		}
 	}
 
+	return repoRoot
+}
+
+// validateAll validates every blueprint under repoRoot, writing each report
+// and the final summary to out.
+//
+//nolint:gocyclo // Complexity is acceptable for main orchestration function
+func validateAll(ctx context.Context, repoRoot string, opts validateAllOptions, out io.Writer) bool {
 	blueprints, err := findAllBlueprints(repoRoot)
 	if err != nil {
-		fmt.Printf("Error finding blueprints: %v\n", err)
+		_, _ = fmt.Fprintf(out, "Error finding blueprints: %v\n", err) //nolint:errcheck // best-effort console output
 		return false
 	}
 
 	if len(blueprints) == 0 {
-		fmt.Println("No blueprints found in repository")
+		_, _ = fmt.Fprintln(out, "No blueprints found in repository") //nolint:errcheck // best-effort console output
 		return false
 	}
 
-	fmt.Printf("Found %d blueprint(s) to validate (Ctrl+C to interrupt)\n\n", len(blueprints))
+	_, _ = fmt.Fprintf(out, "Found %d blueprint(s) to validate (Ctrl+C to interrupt)\n\n", len(blueprints)) //nolint:errcheck // best-effort console output
 
 	// Track partial results for graceful shutdown reporting
 	partialResult := shutdown.NewPartialResult(len(blueprints))
 
-	type result struct {
-		path    string
-		success bool
-	}
-	var results []result
-	interrupted := false
-
-	for _, bp := range blueprints {
-		// Check for context cancellation before each validation
-		select {
-		case <-ctx.Done():
-			interrupted = true
-			completed, total, _, _, _ := partialResult.SummaryWithCounts()
-			fmt.Printf("\nValidation interrupted after %d/%d blueprints\n", completed, total)
-			goto summary
-		default:
+	// Optionally reuse results for blueprints unchanged since the last run
+	var resultCache *cache.Cache
+	if opts.useCache {
+		if key, ok := cacheKey(); ok {
+			resultCache = cache.Load(filepath.Join(repoRoot, cacheFile), key)
+		} else {
+			fmt.Fprintln(os.Stderr, "Warning: could not identify the validator binary, running without the result cache")
 		}
+	}
 
-		v := validator.New(bp)
-		success := v.Validate()
-		results = append(results, result{path: bp, success: success})
+	jobs := opts.jobs
+	if jobs <= 0 {
+		jobs = runtime.NumCPU()
+	}
+	results := validateBlueprints(ctx, blueprints, jobs, opts.failFast, out, partialResult, resultCache)
 
-		// Track partial results
-		if success {
-			partialResult.RecordPass(bp)
+	if resultCache != nil {
+		if saveErr := resultCache.Save(); saveErr != nil {
+			fmt.Fprintf(os.Stderr, "Warning: could not save result cache: %v\n", saveErr)
+		}
+	}
+	// A run ends early either on interrupt or, with --fail-fast, on the first failure
+	incomplete := len(results) < len(blueprints)
+	interrupted := incomplete && ctx.Err() != nil
+	if incomplete {
+		completed, total, _, _, _ := partialResult.SummaryWithCounts()
+		if interrupted {
+			_, _ = fmt.Fprintf(out, "\nValidation interrupted after %d/%d blueprints\n", completed, total) //nolint:errcheck // best-effort console output
 		} else {
-			partialResult.RecordFail(bp, "validation failed")
+			_, _ = fmt.Fprintf(out, "\nValidation stopped after first failure (%d/%d blueprints)\n", completed, total) //nolint:errcheck // best-effort console output
 		}
-
-		fmt.Println(strings.Repeat("-", 80))
-		fmt.Println()
 	}
 
-summary:
-	// Summary
-	fmt.Println(strings.Repeat("=", 80))
-	if interrupted {
-		fmt.Println("PARTIAL SUMMARY (interrupted)")
-	} else {
-		fmt.Println("SUMMARY")
+	// Summary - assembled in memory and written once
+	var summary strings.Builder
+	summary.WriteString(strings.Repeat("=", 80) + "\n")
+	switch {
+	case interrupted:
+		summary.WriteString("PARTIAL SUMMARY (interrupted)\n")
+	case incomplete:
+		summary.WriteString("PARTIAL SUMMARY (stopped after first failure)\n")
+	default:
+		summary.WriteString("SUMMARY\n")
 	}
-	fmt.Println(strings.Repeat("=", 80))
+	summary.WriteString(strings.Repeat("=", 80) + "\n")
 
 	passed := 0
 	for _, r := range results {
@@ -258,8 +312,8 @@ summary:
 	}
 	failed := len(results) - passed
 
-	green := color.New(color.FgGreen).SprintFunc()
-	red := color.New(color.FgRed).SprintFunc()
+	ok := color.New(color.FgGreen).Sprint("OK")
+	fail := color.New(color.FgRed).Sprint("X")
 	yellow := color.New(color.FgYellow).SprintFunc()
 
 	for _, r := range results {
@@ -268,23 +322,151 @@ summary:
 			relPath = r.path
 		}
 		if r.success {
-			fmt.Printf("%s %s\n", green("OK"), relPath)
+			summary.WriteString(ok + " " + relPath + "\n")
 		} else {
-			fmt.Printf("%s %s\n", red("X"), relPath)
+			summary.WriteString(fail + " " + relPath + "\n")
 		}
 	}
 
-	fmt.Println()
-	if interrupted {
+	summary.WriteString("\n")
+	if incomplete {
 		skipped := len(blueprints) - len(results)
-		fmt.Printf("Completed: %d | Passed: %d | Failed: %d | %s: %d\n",
+		fmt.Fprintf(&summary, "Completed: %d | Passed: %d | Failed: %d | %s: %d\n",
 			len(results), passed, failed, yellow("Skipped"), skipped)
 	} else {
-		fmt.Printf("Total: %d | Passed: %d | Failed: %d\n", len(results), passed, failed)
+		fmt.Fprintf(&summary, "Total: %d | Passed: %d | Failed: %d\n", len(results), passed, failed)
+	}
+	_, _ = io.WriteString(out, summary.String()) //nolint:errcheck // best-effort console output
+
+	// Return false if any failures or if the run ended early
+	return failed == 0 && !incomplete
+}
+
+// cacheFile is the result cache location relative to the repository root
+var cacheFile = filepath.Join(".cache", "validate-blueprint", "results.json")
+
+// cacheKey identifies the running validator build for the result cache.
+// Version and commit alone do not change for dev builds or edited working
+// trees, so the binary's size and modification time are part of the key and
+// every rebuild starts from an empty cache.
+func cacheKey() (string, bool) {
+	exe, err := os.Executable()
+	if err != nil {
+		return "", false
+	}
+	info, err := os.Stat(exe)
+	if err != nil {
+		return "", false
+	}
+	return fmt.Sprintf("%s+%s+%d-%d", Version, GitCommit, info.Size(), info.ModTime().UnixNano()), true
+}
+
+// blueprintResult is the outcome of validating a single blueprint
+type blueprintResult struct {
+	path    string
+	success bool
+	output  []byte
+}
+
+// validateBlueprints validates blueprints on a pool of worker goroutines.
+// Each blueprint's report is buffered and written to out in input order, so
+// the output reads the same as a serial run. When ctx is cancelled no new
+// blueprints are started; the returned results cover the completed prefix.
+// With failFast, no new blueprints are started once one has failed and the
+// results end at the first failure.
+// A non-nil resultCache replays results for unchanged files and records new ones.
+func validateBlueprints(ctx context.Context, blueprints []string, workers int, failFast bool, out io.Writer, partialResult *shutdown.PartialResult, resultCache *cache.Cache) []blueprintResult {
+	workers = max(1, min(workers, len(blueprints)))
+
+	ctx, stopDispatch := context.WithCancel(ctx)
+	defer stopDispatch()
+
+	type indexedResult struct {
+		index int
+		blueprintResult
+	}
+
+	jobs := make(chan int)
+	done := make(chan indexedResult, len(blueprints))
+
+	var wg sync.WaitGroup
+	for range workers {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			// Each worker reuses one validator across its blueprints
+			v := validator.New("")
+			for i := range jobs {
+				bp := blueprints[i]
+				// The fingerprint is taken before validation reads the file
+				var fp cache.Fingerprint
+				if resultCache != nil {
+					entry, current, ok := resultCache.Lookup(bp)
+					if ok {
+						done <- indexedResult{index: i, blueprintResult: blueprintResult{path: bp, success: entry.Success, output: []byte(entry.Output)}}
+						continue
+					}
+					fp = current
+				}
+
+				var buf bytes.Buffer
+				v.Reset(bp)
+				v.Out = &buf
+				success := v.Validate()
+				if resultCache != nil {
+					resultCache.Store(bp, fp, success, buf.Bytes())
+				}
+				done <- indexedResult{index: i, blueprintResult: blueprintResult{path: bp, success: success, output: buf.Bytes()}}
+			}
+		}()
+	}
+
+	// Dispatch in order so an interrupted run always completes a prefix
+	go func() {
+		defer close(jobs)
+		for i := range blueprints {
+			select {
+			case <-ctx.Done():
+				return
+			case jobs <- i:
+			}
+		}
+	}()
+
+	go func() {
+		wg.Wait()
+		close(done)
+	}()
+
+	// Emit reports in input order as soon as each one's predecessors are done.
+	// With failFast, nothing after the first failure in input order is reported,
+	// even if workers already finished later blueprints.
+	separator := strings.Repeat("-", 80) + "\n\n"
+	pending := make([]*blueprintResult, len(blueprints))
+	results := make([]blueprintResult, 0, len(blueprints))
+	stopped := false
+	for r := range done {
+		if !r.success && failFast {
+			stopDispatch()
+		}
+
+		pending[r.index] = &r.blueprintResult
+		for !stopped && len(results) < len(pending) && pending[len(results)] != nil {
+			next := pending[len(results)]
+			_, _ = out.Write(next.output)         //nolint:errcheck // best-effort console output
+			_, _ = io.WriteString(out, separator) //nolint:errcheck // best-effort console output
+			results = append(results, *next)
+
+			if next.success {
+				partialResult.RecordPass(next.path)
+			} else {
+				partialResult.RecordFail(next.path, "validation failed")
+				stopped = failFast
+			}
+		}
 	}
 
-	// Return false if any failures or if interrupted
-	return failed == 0 && !interrupted
+	return results
 }
 
 // buildUpdateCommand creates the update subcommand.
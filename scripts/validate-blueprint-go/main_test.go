@@ -0,0 +1,332 @@
+package main
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/cache"
+	"github.com/home-assistant-blueprints/validate-blueprint-go/internal/shutdown"
+)
+
+// validBlueprint passes validation with warnings only
+const validBlueprint = `blueprint:
+  name: Test Blueprint
+  description: A test blueprint
+  domain: automation
+  input: {}
+variables:
+  blueprint_version: "1.0.0"
+trigger:
+  - platform: state
+    entity_id: light.kitchen
+action:
+  - service: light.turn_on
+    target:
+      entity_id: light.kitchen
+`
+
+// invalidBlueprint fails validation because it has no action section
+const invalidBlueprint = `blueprint:
+  name: Broken Blueprint
+  description: A blueprint without actions
+  domain: automation
+  input: {}
+variables:
+  blueprint_version: "1.0.0"
+trigger:
+  - platform: state
+    entity_id: light.kitchen
+`
+
+// writeRepo creates a repository with one blueprint directory per entry in
+// contents and returns its root and the blueprint paths in sorted order
+func writeRepo(t *testing.T, contents []string) (string, []string) {
+	t.Helper()
+	root := t.TempDir()
+	paths := make([]string, 0, len(contents))
+	for i, content := range contents {
+		dir := filepath.Join(root, "blueprints", fmt.Sprintf("bp%03d", i))
+		require.NoError(t, os.MkdirAll(dir, 0o755))
+		path := filepath.Join(dir, "blueprint.yaml")
+		require.NoError(t, os.WriteFile(path, []byte(content), 0o644))
+		paths = append(paths, path)
+	}
+	return root, paths
+}
+
+// mixedContents returns n blueprints where every third one is invalid
+func mixedContents(n int) []string {
+	contents := make([]string, n)
+	for i := range n {
+		if i%3 == 0 {
+			contents[i] = invalidBlueprint
+		} else {
+			contents[i] = validBlueprint
+		}
+	}
+	return contents
+}
+
+// reportedPaths returns the blueprint paths in the order their reports were written
+func reportedPaths(output string) []string {
+	var paths []string
+	for _, line := range strings.Split(output, "\n") {
+		if path, ok := strings.CutPrefix(line, "Validating: "); ok {
+			paths = append(paths, path)
+		}
+	}
+	return paths
+}
+
+// cancelOnWrite cancels a context on the first report written to it
+type cancelOnWrite struct {
+	buf    bytes.Buffer
+	cancel context.CancelFunc
+}
+
+func (w *cancelOnWrite) Write(p []byte) (int, error) {
+	w.cancel()
+	return w.buf.Write(p)
+}
+
+func TestValidateBlueprintsOrder(t *testing.T) {
+	t.Parallel()
+
+	contents := mixedContents(40)
+	_, blueprints := writeRepo(t, contents)
+
+	var out bytes.Buffer
+	results := validateBlueprints(context.Background(), blueprints, 8, false, &out, shutdown.NewPartialResult(len(blueprints)), nil)
+
+	require.Len(t, results, len(blueprints))
+	for i, r := range results {
+		assert.Equal(t, blueprints[i], r.path)
+		assert.Equal(t, contents[i] == validBlueprint, r.success, "result for %s", r.path)
+	}
+	assert.Equal(t, blueprints, reportedPaths(out.String()))
+}
+
+func TestValidateAllSummary(t *testing.T) {
+	t.Parallel()
+
+	t.Run("serial and parallel runs print the same report", func(t *testing.T) {
+		t.Parallel()
+		root, _ := writeRepo(t, mixedContents(12))
+
+		var serial, parallel bytes.Buffer
+		serialOK := validateAll(context.Background(), root, validateAllOptions{jobs: 1}, &serial)
+		parallelOK := validateAll(context.Background(), root, validateAllOptions{jobs: 8}, &parallel)
+
+		assert.False(t, serialOK)
+		assert.False(t, parallelOK)
+		assert.Equal(t, serial.String(), parallel.String())
+		assert.Contains(t, parallel.String(), "SUMMARY\n")
+		assert.NotContains(t, parallel.String(), "PARTIAL SUMMARY")
+		assert.Contains(t, parallel.String(), "Total: 12 | Passed: 8 | Failed: 4\n")
+	})
+
+	t.Run("all valid blueprints succeed", func(t *testing.T) {
+		t.Parallel()
+		root, _ := writeRepo(t, []string{validBlueprint, validBlueprint, validBlueprint})
+
+		var out bytes.Buffer
+		ok := validateAll(context.Background(), root, validateAllOptions{jobs: 2}, &out)
+
+		assert.True(t, ok)
+		assert.Contains(t, out.String(), "Total: 3 | Passed: 3 | Failed: 0\n")
+	})
+
+	t.Run("no blueprints fails", func(t *testing.T) {
+		t.Parallel()
+
+		var out bytes.Buffer
+		ok := validateAll(context.Background(), t.TempDir(), validateAllOptions{}, &out)
+
+		assert.False(t, ok)
+		assert.Contains(t, out.String(), "No blueprints found in repository")
+	})
+}
+
+func TestValidateBlueprintsInterrupt(t *testing.T) {
+	t.Parallel()
+
+	_, blueprints := writeRepo(t, mixedContents(30))
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	out := &cancelOnWrite{cancel: cancel}
+	partialResult := shutdown.NewPartialResult(len(blueprints))
+
+	results := validateBlueprints(ctx, blueprints, 4, false, out, partialResult, nil)
+
+	// Every started blueprint is reported exactly once, as a prefix of the input
+	require.NotEmpty(t, results)
+	reported := make([]string, len(results))
+	for i, r := range results {
+		reported[i] = r.path
+	}
+	assert.Equal(t, blueprints[:len(results)], reported)
+	assert.Equal(t, reported, reportedPaths(out.buf.String()))
+
+	completed, _, _, _, _ := partialResult.SummaryWithCounts()
+	assert.Equal(t, len(results), completed)
+}
+
+func TestValidateAllFailFast(t *testing.T) {
+	t.Parallel()
+
+	for _, jobs := range []int{1, 4} {
+		t.Run(fmt.Sprintf("%d jobs", jobs), func(t *testing.T) {
+			t.Parallel()
+			contents := []string{validBlueprint, validBlueprint, invalidBlueprint}
+			for range 7 {
+				contents = append(contents, validBlueprint)
+			}
+			root, blueprints := writeRepo(t, contents)
+
+			var out bytes.Buffer
+			ok := validateAll(context.Background(), root, validateAllOptions{jobs: jobs, failFast: true}, &out)
+
+			assert.False(t, ok)
+			output := out.String()
+			assert.Equal(t, blueprints[:3], reportedPaths(output))
+			assert.Contains(t, output, "Validation stopped after first failure (3/10 blueprints)\n")
+			assert.Contains(t, output, "PARTIAL SUMMARY (stopped after first failure)\n")
+			assert.Contains(t, output, "Completed: 3 | Passed: 2 | Failed: 1 | ")
+			for _, later := range blueprints[3:] {
+				relPath, err := filepath.Rel(root, later)
+				require.NoError(t, err)
+				assert.NotContains(t, output, relPath)
+			}
+		})
+	}
+}
+
+// cachedReport is stored for blueprints so a replayed result is recognizable
+const cachedReport = "CACHED REPORT\n"
+
+func TestValidateBlueprintsCacheReplay(t *testing.T) {
+	t.Parallel()
+
+	// run validates a single blueprint against a cache that records it as failed
+	run := func(t *testing.T, change func(bp string)) (blueprintResult, string) {
+		t.Helper()
+		_, blueprints := writeRepo(t, []string{validBlueprint})
+		resultCache := cache.Load(filepath.Join(t.TempDir(), "results.json"), "test")
+		_, fp, _ := resultCache.Lookup(blueprints[0])
+		resultCache.Store(blueprints[0], fp, false, []byte(cachedReport))
+		change(blueprints[0])
+
+		var out bytes.Buffer
+		results := validateBlueprints(context.Background(), blueprints, 1, false, &out, shutdown.NewPartialResult(1), resultCache)
+		require.Len(t, results, 1)
+		return results[0], out.String()
+	}
+
+	t.Run("hit replays the stored result", func(t *testing.T) {
+		t.Parallel()
+		result, output := run(t, func(string) {})
+
+		assert.False(t, result.success)
+		assert.Contains(t, output, cachedReport)
+	})
+
+	t.Run("miss after size change", func(t *testing.T) {
+		t.Parallel()
+		result, output := run(t, func(bp string) {
+			require.NoError(t, os.WriteFile(bp, []byte(validBlueprint+"# edited\n"), 0o644))
+		})
+
+		assert.True(t, result.success)
+		assert.NotContains(t, output, cachedReport)
+	})
+
+	t.Run("miss after modification time change", func(t *testing.T) {
+		t.Parallel()
+		result, output := run(t, func(bp string) {
+			later := time.Now().Add(time.Hour)
+			require.NoError(t, os.Chtimes(bp, later, later))
+		})
+
+		assert.True(t, result.success)
+		assert.NotContains(t, output, cachedReport)
+	})
+
+	t.Run("miss after a file is added to the directory", func(t *testing.T) {
+		t.Parallel()
+		result, output := run(t, func(bp string) {
+			require.NoError(t, os.WriteFile(filepath.Join(filepath.Dir(bp), "README.md"), []byte("# Test\n"), 0o644))
+			// Force a distinct directory mtime regardless of filesystem timestamp granularity
+			future := time.Now().Add(time.Hour)
+			require.NoError(t, os.Chtimes(filepath.Dir(bp), future, future))
+		})
+
+		assert.True(t, result.success)
+		assert.NotContains(t, output, cachedReport)
+	})
+}
+
+func TestValidateAllCacheFile(t *testing.T) {
+	t.Parallel()
+
+	key, ok := cacheKey()
+	require.True(t, ok)
+
+	// storeFailure records a blueprint as failed in the repository cache under buildKey
+	storeFailure := func(t *testing.T, root, bp, buildKey string) {
+		t.Helper()
+		resultCache := cache.Load(filepath.Join(root, cacheFile), buildKey)
+		_, fp, _ := resultCache.Lookup(bp)
+		resultCache.Store(bp, fp, false, []byte(cachedReport))
+		require.NoError(t, resultCache.Save())
+	}
+
+	t.Run("hit for the running build", func(t *testing.T) {
+		t.Parallel()
+		root, blueprints := writeRepo(t, []string{validBlueprint})
+		storeFailure(t, root, blueprints[0], key)
+
+		var out bytes.Buffer
+		ok := validateAll(context.Background(), root, validateAllOptions{useCache: true}, &out)
+
+		assert.False(t, ok)
+		assert.Contains(t, out.String(), cachedReport)
+	})
+
+	t.Run("other build is ignored", func(t *testing.T) {
+		t.Parallel()
+		root, blueprints := writeRepo(t, []string{validBlueprint})
+		storeFailure(t, root, blueprints[0], key+"-other")
+
+		var out bytes.Buffer
+		ok := validateAll(context.Background(), root, validateAllOptions{useCache: true}, &out)
+
+		assert.True(t, ok)
+		assert.NotContains(t, out.String(), cachedReport)
+	})
+
+	t.Run("corrupt file is ignored and rewritten", func(t *testing.T) {
+		t.Parallel()
+		root, _ := writeRepo(t, []string{validBlueprint})
+		path := filepath.Join(root, cacheFile)
+		require.NoError(t, os.MkdirAll(filepath.Dir(path), 0o755))
+		require.NoError(t, os.WriteFile(path, []byte("{not json"), 0o644))
+
+		var out bytes.Buffer
+		ok := validateAll(context.Background(), root, validateAllOptions{useCache: true}, &out)
+
+		assert.True(t, ok)
+		data, err := os.ReadFile(path)
+		require.NoError(t, err)
+		assert.True(t, json.Valid(data))
+	})
+}